@@ -141,7 +141,7 @@ async def demonstrate_infinite_conversation(
     print(f"Final session {current_session_id} has {len(ancestors)} ancestors:")
     for i, ancestor in enumerate(ancestors):
         print(f"  Ancestor {i+1}: {ancestor.id}")
-        summary_event = next((e for e in reversed(ancestor.events) if e.type == EventType.SUMMARY), None)
+        summary_event = next((e for e in reversed(ancestor.events) if e.type is EventType.SUMMARY), None)
         if summary_event:
             print(f"    Summary: {str(summary_event.message)[:100]}...")
     
@@ -202,7 +202,7 @@ async def compare_summarization_strategies():
                 # Get the summary from the original session
                 orig_session = await store.get(session_id)
                 summary_event = next((e for e in reversed(orig_session.events) 
-                                     if e.type == EventType.SUMMARY), None)
+                                     if e.type is EventType.SUMMARY), None)
                 
                 if summary_event:
                     summary_text = summary_event.message
@@ -294,4 +294,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
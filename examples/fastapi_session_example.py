@@ -11,6 +11,7 @@ Run with:
 Then open http://localhost:8000/docs
 """
 
+import asyncio
 import json
 import logging
 from contextlib import asynccontextmanager
@@ -20,9 +21,15 @@ import uvicorn
 from fastapi import BackgroundTasks, FastAPI, HTTPException
 from pydantic import BaseModel
 
+try:
+    import orjson  # optional: much faster JSON encoding
+except ImportError:
+    orjson = None
+
 from chuk_session_manager.models.event_source import EventSource
 from chuk_session_manager.models.event_type import EventType
 from chuk_session_manager.models.session import Session, SessionEvent
+from chuk_session_manager.models.token_usage import TokenUsage
 from chuk_session_manager.session_prompt_builder import (
     PromptStrategy,
     build_prompt_from_session,
@@ -51,37 +58,39 @@ async def lifespan(app: FastAPI):
     """FastAPI lifespan context – replaces @app.on_event."""
     logger.info("Creating sample session data")
 
-    # parent session
+    # parent → child hierarchy (creating the child links it to the parent)
     parent = await Session.create()
-    await parent.add_event(
-        SessionEvent(
-            message="What's the weather like today?",
-            source=EventSource.USER,
-            type=EventType.MESSAGE,
-        )
+    child = await Session.create(parent_id=parent.id)
+
+    await parent.add_events(
+        [
+            SessionEvent(
+                message="What's the weather like today?",
+                source=EventSource.USER,
+                type=EventType.MESSAGE,
+            ),
+            SessionEvent(
+                message="I'll check the weather for you.",
+                source=EventSource.LLM,
+                type=EventType.MESSAGE,
+            ),
+        ]
     )
-    await parent.add_event(
-        SessionEvent(
-            message="I'll check the weather for you.",
-            source=EventSource.LLM,
-            type=EventType.MESSAGE,
-        )
+    await child.add_events(
+        [
+            SessionEvent(
+                message="What about tomorrow's forecast?",
+                source=EventSource.USER,
+                type=EventType.MESSAGE,
+            )
+        ]
     )
-    await store.save(parent)
 
-    # child session
-    child = await Session.create(parent_id=parent.id)
-    await child.add_event(
-        SessionEvent(
-            message="What about tomorrow's forecast?",
-            source=EventSource.USER,
-            type=EventType.MESSAGE,
-        )
-    )
-    await store.save(child)
+    # the two saves are independent
+    await asyncio.gather(store.save(parent), store.save(child))
 
-    logger.info(f"Created sample parent session: {parent.id}")
-    logger.info(f"Created sample child  session: {child.id}")
+    logger.info("Created sample parent session: %s", parent.id)
+    logger.info("Created sample child  session: %s", child.id)
 
     yield  # application runs here
 
@@ -161,18 +170,17 @@ async def create_session(background_tasks: BackgroundTasks, parent_id: Optional[
 
 @app.get("/sessions", response_model=List[SessionResponse])
 async def list_sessions():
-    sessions: List[SessionResponse] = []
-    for sid in await store.list_sessions():
-        if (s := await store.get(sid)) is not None:
-            sessions.append(
-                SessionResponse(
-                    id=s.id,
-                    event_count=len(s.events),
-                    parent_id=s.parent_id,
-                    child_ids=s.child_ids,
-                )
-            )
-    return sessions
+    found = await store.get_many(await store.list_sessions())
+    return [
+        SessionResponse(
+            id=s.id,
+            event_count=len(s.events),
+            parent_id=s.parent_id,
+            child_ids=s.child_ids,
+        )
+        for s in found
+        if s is not None
+    ]
 
 
 @app.get("/sessions/{session_id}", response_model=SessionResponse)
@@ -252,9 +260,12 @@ async def build_prompt(session_id: str, req: PromptRequest):
 
     token_estimate = None
     if prompt:
-        from chuk_session_manager.models.token_usage import TokenUsage
-
-        est = TokenUsage.count_tokens(json.dumps(prompt))
+        prompt_json = (
+            orjson.dumps(prompt).decode()
+            if orjson is not None
+            else json.dumps(prompt, separators=(",", ":"), ensure_ascii=False)
+        )
+        est = TokenUsage.count_tokens(prompt_json)
         token_estimate = await est if asyncio.iscoroutine(est) else est
 
     return PromptResponse(prompt=prompt, token_estimate=token_estimate)
@@ -287,5 +298,4 @@ async def delete_session(session_id: str):
 # CLI
 # --------------------------------------------------------------------------- #
 if __name__ == "__main__":
-    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -22,14 +22,25 @@ Run it::
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
-import pprint
+import sys
+import time
+from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
+from typing import Any
 
+import httpx
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 
+try:
+    import orjson  # optional: much faster JSON rendering
+except ImportError:
+    orjson = None
+
 # Session-manager imports
 from chuk_session_manager.storage.providers.memory import InMemorySessionStore
 from chuk_session_manager.storage import SessionStoreProvider
@@ -45,63 +56,172 @@ from chuk_session_manager.session_aware_tool_processor import (
 from chuk_tool_processor.registry.tool_export import openai_functions
 from sample_tools import WeatherTool, SearchTool, CalculatorTool  # noqa: F401  pylint: disable=unused-import
 
+# The tool set is fixed once the imports above have run, so export the
+# OpenAI function schema a single time instead of on every request.
+TOOLS_SCHEMA = openai_functions()
+
 ###############################################################################
 # Logging
 ###############################################################################
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
 logger = logging.getLogger(__name__)
 
+###############################################################################
+# HTTP transport
+###############################################################################
+# httpx is already an openai dependency; widen its default pool so
+# concurrent tool round-trips reuse warm keep-alive connections.
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+HTTP_TIMEOUT = httpx.Timeout(60.0)
+
+###############################################################################
+# Client-side rate limiting
+###############################################################################
+class AsyncTokenBucket:
+    """Requests-per-minute / tokens-per-minute limiter for LLM calls.
+
+    Mirrors the OpenAI cookbook's parallel request processor: both budgets
+    refill continuously and :meth:`acquire` waits until one request plus
+    the estimated tokens fit, so bursts stay just below the 429 cliff.
+    """
+
+    def __init__(self, max_requests_per_minute: int, max_tokens_per_minute: int) -> None:
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self._requests = float(max_requests_per_minute)
+        self._tokens = float(max_tokens_per_minute)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed, self._last = now - self._last, now
+        self._requests = min(
+            self.max_requests_per_minute,
+            self._requests + elapsed * self.max_requests_per_minute / 60,
+        )
+        self._tokens = min(
+            self.max_tokens_per_minute,
+            self._tokens + elapsed * self.max_tokens_per_minute / 60,
+        )
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request and *tokens* tokens are available, then take them."""
+        tokens = min(tokens, self.max_tokens_per_minute)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep(
+                    max(
+                        (1 - self._requests) * 60 / self.max_requests_per_minute,
+                        (tokens - self._tokens) * 60 / self.max_tokens_per_minute,
+                    )
+                )
+
+
+# Tier-2 defaults for gpt-4o-mini
+LLM_BUCKET = AsyncTokenBucket(max_requests_per_minute=3500, max_tokens_per_minute=90_000)
+
 ###############################################################################
 # Helpers
 ###############################################################################
+_client: AsyncOpenAI | None = None
+
+
 async def get_openai_client() -> AsyncOpenAI:
-    """Return an :class:`AsyncOpenAI` client after a quick sanity ping."""
+    """Return the shared :class:`AsyncOpenAI` client, creating it on first use.
+
+    Reusing one client keeps its connection pool warm across calls. The key
+    is validated lazily by the first real request; set
+    ``OPENAI_SANITY_PING=1`` to fail fast with a 1-token call instead.
+    """
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        return _client
+
     load_dotenv()
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY must be set (env or .env file)")
 
-    client = AsyncOpenAI(api_key=api_key)
-
-    # Cheap 1-token call just to fail fast if the key / networking is wrong
-    await client.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": "ping"}],
-        max_tokens=1,
+    client = AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
     )
+
+    # Optional cheap 1-token call to fail fast if the key / networking is wrong
+    if os.getenv("OPENAI_SANITY_PING") == "1":
+        await client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "ping"}],
+            max_tokens=1,
+        )
+    _client = client
     return client
 
 
+async def close_openai_client() -> None:
+    """Close the shared client, if any, releasing its connection pool."""
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+def format_result(value: Any) -> str:
+    """Render a tool result as indented JSON (via orjson when installed)."""
+    if hasattr(value, "model_dump"):
+        value = value.model_dump()
+    if orjson is not None:
+        return orjson.dumps(
+            value, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        ).decode()
+    return json.dumps(value, default=str, indent=2, sort_keys=True)
+
+
+_PADDED_TYPE = {t: f"{t.value:9}" for t in EventType}
+
+
 async def pretty_event_tree(session: Session) -> None:
     """Walk the session's events and print them as an indented tree."""
 
-    # Map event-id → list[child events]
-    children: dict[str, list[SessionEvent]] = {}
+    # Single pass: bucket every event under its parent (or as a root)
+    roots: list[SessionEvent] = []
+    children: dict[str, list[SessionEvent]] = defaultdict(list)
     for evt in session.events:
         parent = await evt.get_metadata("parent_event_id")
-        if parent:
-            children.setdefault(parent, []).append(evt)
+        (children[parent] if parent else roots).append(evt)
+
+    by_time = attrgetter("timestamp")
+    roots.sort(key=by_time)
+    for siblings in children.values():
+        siblings.sort(key=by_time)
 
-    async def _dump(evt: SessionEvent, depth: int = 0) -> None:
+    lines: list[str] = []
+    stack = [(root, 0) for root in reversed(roots)]
+    while stack:
+        evt, depth = stack.pop()
         pad = "  " * depth
-        print(f"{pad}• {evt.type.value:10} id={evt.id}")
-        if evt.type == EventType.TOOL_CALL:
+        lines.append(f"{pad}• {_PADDED_TYPE[evt.type]} id={evt.id}")
+        if evt.type is EventType.TOOL_CALL:
             msg = evt.message or {}
-            print(f"{pad}  ↳ {msg.get('tool')} | error={msg.get('error')}")
-        for child in sorted(children.get(evt.id, []), key=lambda e: e.timestamp):
-            await _dump(child, depth + 1)
-
-    roots = [e for e in session.events if not await e.get_metadata("parent_event_id")]
-    for root in sorted(roots, key=lambda e: e.timestamp):
-        await _dump(root)
+            lines.append(f"{pad}  ↳ {msg.get('tool')} | error={msg.get('error')}")
+        stack.extend((child, depth + 1) for child in reversed(children.get(evt.id, ())))
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def call_llm(client: AsyncOpenAI, prompt: str) -> dict:
     """Query the LLM with our tools, returning the raw assistant message dict."""
+    await LLM_BUCKET.acquire(tokens=len(prompt) // 4)
     response = await client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[{"role": "user", "content": prompt}],
-        tools=openai_functions(),
+        tools=TOOLS_SCHEMA,
         tool_choice="auto",
         temperature=0.7,
     )
@@ -113,58 +233,65 @@ async def call_llm(client: AsyncOpenAI, prompt: str) -> dict:
 ###############################################################################
 async def main() -> None:
     client = await get_openai_client()
+    try:
+        # In-memory store so the demo is completely self-contained
+        store = InMemorySessionStore()
+        SessionStoreProvider.set_store(store)
 
-    # In-memory store so the demo is completely self-contained
-    store = InMemorySessionStore()
-    SessionStoreProvider.set_store(store)
-
-    session = await Session.create()
+        session = await Session.create()
 
-    # Processor that will run/record tool calls for this session
-    processor = await SessionAwareToolProcessor.create(session_id=session.id)
+        # Processor that will run/record tool calls for this session
+        processor = await SessionAwareToolProcessor.create(session_id=session.id)
 
-    user_prompt = (
-        "I need to know if I should wear a jacket today in New York.\n"
-        "Also, how much is 235.5 × 18.75?\n"
-        "Finally, find a couple of pages on climate-change adaptation."
-    )
+        user_prompt = (
+            "I need to know if I should wear a jacket today in New York.\n"
+            "Also, how much is 235.5 × 18.75?\n"
+            "Finally, find a couple of pages on climate-change adaptation."
+        )
 
-    # Record the USER event (with token accounting)
-    user_event = await SessionEvent.create_with_tokens(
-        message=user_prompt,
-        prompt=user_prompt,
-        model="gpt-4o-mini",
-        source=EventSource.USER,
-    )
-    await session.add_event_and_save(user_event)
+        # Record the USER event (with token accounting)
+        user_event = await SessionEvent.create_with_tokens(
+            message=user_prompt,
+            prompt=user_prompt,
+            model="gpt-4o-mini",
+            source=EventSource.USER,
+        )
+        await session.add_event_and_save(user_event)
 
-    # Ask the model (tools will be suggested/run automatically)
-    assistant_msg = await call_llm(client, user_prompt)
+        # Ask the model (tools will be suggested/run automatically)
+        assistant_msg = await call_llm(client, user_prompt)
 
-    # Execute + log tool calls
-    tool_results = await processor.process_llm_message(assistant_msg, lambda _: call_llm(client, _))
+        # Execute + log tool calls
+        tool_results = await processor.process_llm_message(assistant_msg, lambda _: call_llm(client, _))
 
-    # Refresh session from store to include new events
-    session = await store.get(session.id)
+        # Refresh session from store to include new events
+        session = await store.get(session.id)
 
-    # --- Display ------------------------------------------------------------------ #
-    print(f"\nExecuted {len(tool_results)} tool calls")
-    for r in tool_results:
-        print(f"\n→ {r.tool}")
-        pprint.pp(r.result)
+        # --- Display ------------------------------------------------------------------ #
+        print(f"\nExecuted {len(tool_results)} tool calls")
+        for r in tool_results:
+            print(f"\n→ {r.tool}")
+            print(format_result(r.result))
 
-    print("\nSession event tree:")
-    await pretty_event_tree(session)
+        print("\nSession event tree:")
+        await pretty_event_tree(session)
 
-    # Simple token/cost overview if the tracking is available
-    if session.total_tokens:
-        print(
-            f"\nToken usage: {session.total_tokens} tokens – "
-            f"estimated cost ${session.total_cost:.6f}"
-        )
-        for model, usage in session.token_summary.usage_by_model.items():
-            print(f"  {model}: {usage.total_tokens} tokens (${usage.estimated_cost_usd:.6f})")
+        # Simple token/cost overview if the tracking is available
+        if session.total_tokens:
+            print(
+                f"\nToken usage: {session.total_tokens} tokens – "
+                f"estimated cost ${session.total_cost:.6f}"
+            )
+            for model, usage in session.token_summary.usage_by_model.items():
+                print(f"  {model}: {usage.total_tokens} tokens (${usage.estimated_cost_usd:.6f})")
+    finally:
+        await close_openai_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
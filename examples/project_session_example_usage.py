@@ -20,6 +20,7 @@ references to the key objects (handy for notebooks/tests).
 
 from __future__ import annotations
 import asyncio
+import sys
 
 # ── Storage providers ────────────────────────────────────────────────
 from chuk_session_manager.storage import InMemorySessionStore, SessionStoreProvider
@@ -39,13 +40,18 @@ from chuk_session_manager.models.session_run import SessionRun
 
 async def print_event_tree(sess: Session, indent: int = 0) -> None:  # helper
     """Pretty-print a Session hierarchy for quick inspection."""
-    pad = "  " * indent
-    print(f"{pad}• session {sess.id}")
-    for child_id in sess.child_ids:
-        store = SessionStoreProvider.get_store()
-        child = await store.get(child_id)
-        if child:
-            await print_event_tree(child, indent + 1)
+    store = SessionStoreProvider.get_store()
+    lines: list[str] = []
+
+    async def _walk(node: Session, depth: int) -> None:
+        lines.append(f"{'  ' * depth}• session {node.id}")
+        for child_id in node.child_ids:
+            child = await store.get(child_id)
+            if child:
+                await _walk(child, depth + 1)
+
+    await _walk(sess, indent)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def main():  # async demo script
@@ -76,17 +82,18 @@ async def main():  # async demo script
     print(f"   → Project {proj.id} now has sessions: {proj.session_ids}")
 
     # 5) Record a couple of chat events and save -------------------------------------
-    await root.add_event_and_save(SessionEvent(
-        message="Hey, how are you?",
-        source=EventSource.USER,
-        type=EventType.MESSAGE,
-    ))
-    
-    await root.add_event_and_save(SessionEvent(
-        message="I'm fine, thanks!",
-        source=EventSource.LLM,
-        type=EventType.MESSAGE,
-    ))
+    await root.add_events_and_save([
+        SessionEvent(
+            message="Hey, how are you?",
+            source=EventSource.USER,
+            type=EventType.MESSAGE,
+        ),
+        SessionEvent(
+            message="I'm fine, thanks!",
+            source=EventSource.LLM,
+            type=EventType.MESSAGE,
+        ),
+    ])
     
     print(f"   • Recorded {len(root.events)} events; last at {root.last_update_time}")
 
@@ -123,4 +130,9 @@ async def main():  # async demo script
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
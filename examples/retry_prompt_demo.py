@@ -4,7 +4,8 @@ examples/retry_prompt_demo.py
 ─────────────────────────────
 Illustrates:
 
-• How you might retry an LLM call until it proposes a tool-call.
+• How you might retry an LLM call until it proposes a tool-call, racing
+  LLM_CONCURRENCY speculative attempts per round.
 • SessionAwareToolProcessor execution / event logging.
 • Prompt pruning with build_prompt_from_session().
 """
@@ -14,9 +15,17 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import pprint
+import sys
+from operator import attrgetter
 from typing import Dict, List
 
+try:
+    import orjson  # optional: much faster JSON encoding
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.WARNING, format="%(levelname)s | %(message)s")
 
 # ── sample tool (self-registers) ────────────────────────────────────────────
@@ -36,53 +45,93 @@ from chuk_session_manager.session_prompt_builder import build_prompt_from_sessio
 ##############################################################################
 ATTEMPTS = 0
 
+# Speculative LLM attempts fired per retry round (1 = plain sequential retries)
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))
+if LLM_CONCURRENCY < 1:
+    raise ValueError(f"LLM_CONCURRENCY must be >= 1, got {LLM_CONCURRENCY}")
+
+
+# Canned replies, built once at import
+# Invalid assistant reply (no tool_calls) – forces a retry loop below
+_PLAIN_REPLY: Dict = {"role": "assistant", "content": "Weather is nice!", "tool_calls": []}
+# Proper function call
+_TOOL_CALL_REPLY: Dict = {
+    "role": "assistant",
+    "content": None,
+    "tool_calls": [
+        {
+            "id": "call_1",
+            "type": "function",
+            "function": {
+                "name": "weather",
+                "arguments": '{"location": "London"}',
+            },
+        }
+    ],
+}
+
 
 async def fake_llm(_: List[Dict] | str) -> Dict:
     """Return a plain assistant answer first, a valid tool-call next."""
     global ATTEMPTS  # noqa: PLW0603
     ATTEMPTS += 1
 
-    if ATTEMPTS == 1:
-        # Invalid assistant reply (no tool_calls) – forces a retry loop below
-        return {"role": "assistant", "content": "Weather is nice!", "tool_calls": []}
-
-    # Second attempt – proper function call
-    return {
-        "role": "assistant",
-        "content": None,
-        "tool_calls": [
-            {
-                "id": "call_1",
-                "type": "function",
-                "function": {
-                    "name": "weather",
-                    "arguments": '{"location": "London"}',
-                },
-            }
-        ],
-    }
+    return dict(_PLAIN_REPLY if ATTEMPTS == 1 else _TOOL_CALL_REPLY)
+
+
+async def race_for_tool_calls(prompt: List[Dict] | str) -> tuple[Dict | None, List[Dict]]:
+    """Fire LLM_CONCURRENCY attempts at once and keep the first with tool_calls.
+
+    Returns the winning message (or None) plus the plain replies that
+    arrived before it; attempts still in flight are cancelled.
+    """
+
+    tasks = [asyncio.create_task(fake_llm(prompt)) for _ in range(LLM_CONCURRENCY)]
+    plain: List[Dict] = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            msg = await next_done
+            if msg.get("tool_calls"):
+                return msg, plain
+            plain.append(msg)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return None, plain
 
 
 ##############################################################################
 # Pretty-printing helpers
 ##############################################################################
+_PADDED_TYPE = {t: f"{t.value:9}" for t in EventType}
+
+
 async def print_event_tree(sess: Session) -> None:
     """Indented tree by parent_event_id metadata."""
+    roots: list[SessionEvent] = []
     children: dict[str, list[SessionEvent]] = {}
     for e in sess.events:
         parent = await e.get_metadata("parent_event_id")
         if parent:
             children.setdefault(parent, []).append(e)
-
-    async def _dump(evt: SessionEvent, depth: int = 0) -> None:
+        else:
+            roots.append(e)
+
+    # children print in timestamp order under their parent
+    by_time = attrgetter("timestamp")
+    roots.sort(key=by_time)
+    for siblings in children.values():
+        siblings.sort(key=by_time)
+
+    lines: list[str] = []
+    stack = [(r, 0) for r in reversed(roots)]
+    while stack:
+        evt, depth = stack.pop()
         pad = "  " * depth
-        print(f"{pad}• {evt.type.value:9} id={evt.id}")
-        for ch in sorted(children.get(evt.id, []), key=lambda x: x.timestamp):
-            await _dump(ch, depth + 1)
-
-    roots = [e for e in sess.events if not await e.get_metadata("parent_event_id")]
-    for r in sorted(roots, key=lambda x: x.timestamp):
-        await _dump(r)
+        lines.append(f"{pad}• {_PADDED_TYPE[evt.type]} id={evt.id}")
+        stack.extend((ch, depth + 1) for ch in reversed(children.get(evt.id, ())))
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 ##############################################################################
@@ -110,21 +159,24 @@ async def main() -> None:
         enable_caching=False,
     )
 
-    # 3) Retry loop: keep asking fake_llm until we get tool_calls
+    # 3) Retry loop: race speculative fake_llm calls until one has tool_calls
     while True:
-        assistant_msg = await fake_llm("prompt")
-        if assistant_msg.get("tool_calls"):
+        assistant_msg, plain_replies = await race_for_tool_calls("prompt")
+
+        # Log the “plain” assistant messages so the history looks realistic
+        if plain_replies:
+            await session.add_events_and_save([
+                SessionEvent(
+                    message=reply,
+                    type=EventType.MESSAGE,
+                    source=EventSource.LLM,
+                )
+                for reply in plain_replies
+            ])
+
+        if assistant_msg:
             break   # got a callable answer
 
-        # Log the “plain” assistant message so the history looks realistic
-        await session.add_event_and_save(
-            SessionEvent(
-                message=assistant_msg,
-                type=EventType.MESSAGE,
-                source=EventSource.LLM,
-            )
-        )
-
     # 4) Execute the tool calls + log
     tool_results = await processor.process_llm_message(assistant_msg, fake_llm)
 
@@ -134,7 +186,12 @@ async def main() -> None:
     # 5) Outputs
     print("\nTool execution results:")
     for res in tool_results:
-        print(json.dumps(getattr(res, "result", None), default=str, indent=2))
+        result = getattr(res, "result", None)
+        if orjson is not None:
+            dumped = orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2).decode()
+        else:
+            dumped = json.dumps(result, default=str, indent=2, ensure_ascii=False)
+        sys.stdout.write(dumped + "\n")
 
     print("\nHierarchical Session Events:")
     await print_event_tree(session)
@@ -145,4 +202,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -14,6 +14,11 @@ import json
 import logging
 from typing import Any, Dict, List
 
+try:
+    import orjson  # optional: much faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
 from chuk_tool_processor.core.processor import ToolProcessor
 from chuk_tool_processor.models.tool_call import ToolCall
 from chuk_tool_processor.models.tool_result import ToolResult
@@ -31,6 +36,21 @@ logging.basicConfig(level=logging.INFO,
                     format="%(asctime)s | %(levelname)s | %(message)s")
 
 
+# ─────────────────────────── JSON helpers ────────────────────────────
+def _dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False, default=None) -> str:
+    """json.dumps replacement that uses orjson when it is installed."""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=default, option=option).decode()
+    return json.dumps(
+        obj, indent=2 if indent else None, sort_keys=sort_keys,
+        ensure_ascii=False, default=default,
+    )
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 # ─────────────────────────── core processor ──────────────────────────
 class SessionAwareToolProcessor:
     """Run tool-calls, add retry/caching, and log them into a session."""
@@ -48,6 +68,8 @@ class SessionAwareToolProcessor:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self._cache: Dict[str, Any] = {}
+        # resolved once; every message and tool event is saved through it
+        self._store = SessionStoreProvider.get_store()
 
         self._tp = ToolProcessor()
         if not hasattr(self._tp, "executor"):
@@ -66,19 +88,10 @@ class SessionAwareToolProcessor:
         return await v if asyncio.iscoroutine(v) else v
 
     def _cache_key(self, tool: str, args: Dict[str, Any]) -> str:
-        blob = f"{tool}:{json.dumps(args, sort_keys=True)}"
+        blob = f"{tool}:{_dumps(args, sort_keys=True, default=str)}"
         return hashlib.md5(blob.encode()).hexdigest()
 
-    async def _run_calls(self, raw_calls: List[Dict[str, Any]]) -> List[ToolResult]:
-        tcalls: List[ToolCall] = []
-        for c in raw_calls:
-            fn = c["function"]
-            try:
-                args = json.loads(fn["arguments"])
-            except json.JSONDecodeError:
-                args = {"raw": fn["arguments"]}
-            tcalls.append(ToolCall(tool=fn["name"], arguments=args))
-
+    async def _run_calls(self, tcalls: List[ToolCall]) -> List[ToolResult]:
         results = await self._tp.executor.execute(tcalls)
         for r in results:
             r.result = await self._await(r.result)
@@ -101,9 +114,9 @@ class SessionAwareToolProcessor:
             safe_res = safe_res.model_dump()
 
         try:
-            completion = json.dumps(safe_res, ensure_ascii=False)
+            completion = _dumps(safe_res)
         except TypeError:
-            completion = json.dumps(str(safe_res), ensure_ascii=False)
+            completion = _dumps(str(safe_res))
 
         ev = await SessionEvent.create_with_tokens(
             message={
@@ -113,7 +126,7 @@ class SessionAwareToolProcessor:
                 "error":  res.error,
                 "cached": cached,
             },
-            prompt=f"{res.tool}({json.dumps(safe_args, default=str)})",
+            prompt=f"{res.tool}({_dumps(safe_args, default=str)})",
             completion=completion if safe_res is not None else "",
             model="tool-execution",
             source=EventSource.SYSTEM,
@@ -123,24 +136,25 @@ class SessionAwareToolProcessor:
         await ev.update_metadata("attempt", attempt)
         if failed:
             await ev.update_metadata("failed", True)
-        await session.add_event_and_save(ev)
+        await session.add_event(ev)
+        await self._store.save(session)
 
     # ── public entry ────────────────────────────────────────────────
     async def process_llm_message(self, llm_msg: Dict[str, Any]) -> List[ToolResult]:
-        store = SessionStoreProvider.get_store()
-        session = await store.get(self.session_id)
+        session = await self._store.get(self.session_id)
         if not session:
             raise ValueError(f"Session {self.session_id!r} not found")
 
         parent = await SessionEvent.create_with_tokens(
             message=llm_msg,
             prompt="",
-            completion=json.dumps(llm_msg),
+            completion=_dumps(llm_msg),
             model="gpt-4o-mini",
             source=EventSource.LLM,
             type=EventType.MESSAGE,
         )
-        await session.add_event_and_save(parent)
+        await session.add_event(parent)
+        await self._store.save(session)
 
         calls = llm_msg.get("tool_calls", [])
         if not calls:
@@ -150,11 +164,17 @@ class SessionAwareToolProcessor:
         for raw_call in calls:
             fn = raw_call["function"]
             name = fn["name"]
-            try:
-                args = json.loads(fn["arguments"])
-            except json.JSONDecodeError:
-                args = {"raw": fn["arguments"]}
+            raw_args = fn["arguments"]
+            if isinstance(raw_args, dict):  # already decoded – skip the parse
+                args = raw_args
+            else:
+                try:
+                    args = _loads(raw_args)
+                except json.JSONDecodeError:
+                    args = {"raw": raw_args}
 
+            # parsed once – the same ToolCall is reused for every retry
+            tcall = ToolCall(tool=name, arguments=args)
             ck = self._cache_key(name, args) if self.enable_caching else None
             if ck and ck in self._cache:
                 res: ToolResult = self._cache[ck]
@@ -165,7 +185,7 @@ class SessionAwareToolProcessor:
             last_err: str | None = None
             for attempt in range(1, self.max_retries + 2):
                 try:
-                    res = (await self._run_calls([raw_call]))[0]
+                    res = (await self._run_calls([tcall]))[0]
                     if ck:
                         self._cache[ck] = res
                     await self._log_event(session, parent, res, attempt, cached=False)
@@ -185,6 +205,25 @@ class SessionAwareToolProcessor:
 
 
 # ─────────────────────────── demo harness ───────────────────────────
+_PADDED_TYPE = {t: f"{t.value:9}" for t in EventType}
+
+# The assistant reply the demo feeds in – constant, so built once at import
+_WEATHER_CALL_MSG: Dict[str, Any] = {
+    "role": "assistant",
+    "content": None,
+    "tool_calls": [
+        {
+            "id": "call_1",
+            "type": "function",
+            "function": {
+                "name": "weather",
+                "arguments": _dumps({"location": "London"}),
+            },
+        }
+    ],
+}
+
+
 async def _demo() -> None:
     """Minimal self-test when the file is executed directly."""
     # 1) In-memory store & session
@@ -197,50 +236,45 @@ async def _demo() -> None:
 
     proc = await SessionAwareToolProcessor.create(session.id)
 
-    assistant_msg = {
-        "role": "assistant",
-        "content": None,
-        "tool_calls": [
-            {
-                "id": "call_1",
-                "type": "function",
-                "function": {
-                    "name": "weather",
-                    "arguments": json.dumps({"location": "London"}),
-                },
-            }
-        ],
-    }
-
-    results = await proc.process_llm_message(assistant_msg)
+    results = await proc.process_llm_message(_WEATHER_CALL_MSG)
     print("\nTool execution results:")
     for r in results:
         val = r.result
         if hasattr(val, "model_dump"):
             val = val.model_dump()
         try:
-            print(json.dumps(val, indent=2, ensure_ascii=False))
+            print(_dumps(val, indent=True))
         except TypeError:
             print(str(val))
 
     print("\nHierarchical Session Events:")
 
-    async def _tree(evt: SessionEvent, depth=0):
+    # Read each event's parent once instead of rescanning per node
+    roots: list[SessionEvent] = []
+    children: dict[str, list[SessionEvent]] = {}
+    for e in session.events:
+        parent = await e.get_metadata("parent_event_id")
+        if parent:
+            children.setdefault(parent, []).append(e)
+        else:
+            roots.append(e)
+
+    stack = [(root, 0) for root in reversed(roots)]
+    while stack:
+        evt, depth = stack.pop()
         pad = "  " * depth
-        print(f"{pad}• {evt.type.value:9} id={evt.id}")
-        for ch in [e for e in session.events
-                   if await e.get_metadata("parent_event_id") == evt.id]:
-            await _tree(ch, depth + 1)
-
-    roots = [e for e in session.events
-             if not await e.get_metadata("parent_event_id")]
-    for root in roots:
-        await _tree(root)
+        print(f"{pad}• {_PADDED_TYPE[evt.type]} id={evt.id}")
+        stack.extend((ch, depth + 1) for ch in reversed(children.get(evt.id, ())))
 
     nxt = await build_prompt_from_session(session)
     print("\nNext-turn prompt that would be sent to the LLM:")
-    print(json.dumps(nxt, indent=2, ensure_ascii=False))
+    print(_dumps(nxt, indent=True))
 
 
 if __name__ == "__main__":
-    asyncio.run(_demo())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(_demo())
+    else:
+        uvloop.run(_demo())
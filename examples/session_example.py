@@ -13,6 +13,7 @@ Async Session-manager demo
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 from typing import List
 
@@ -42,9 +43,11 @@ async def describe_session(sess: Session) -> None:
     for run in sess.runs:
         log.info("  run %s ⇒ %s", run.id, run.status.value)
 
-    if (anc := await sess.ancestors()):
+    # the two walks are independent – run them concurrently
+    anc, desc = await asyncio.gather(sess.ancestors(), sess.descendants())
+    if anc:
         log.info("  ancestors: %s", [a.id for a in anc])
-    if (desc := await sess.descendants()):
+    if desc:
         log.info("  descendants: %s", [d.id for d in desc])
 
 # ─────────────────────────── main demo ──────────────────────────────
@@ -55,51 +58,55 @@ async def main() -> None:
 
     # 1. simple session ------------------------------------------------
     simple = await Session.create()
-    await simple.add_event_and_save(SessionEvent(
-        message="Hello! I have a question about quantum computing.",
-        source=EventSource.USER,
-    ))
-    await simple.add_event_and_save(SessionEvent(
-        message="Sure – what would you like to know?",
-        source=EventSource.LLM,
-    ))
-    await simple.add_event_and_save(SessionEvent(
-        message="Can you explain entanglement in simple terms?",
-        source=EventSource.USER,
-    ))
-    await simple.add_event_and_save(SessionEvent(
-        message="User asked about quantum computing & entanglement.",
-        source=EventSource.LLM,
-        type=EventType.SUMMARY,
-    ))
+    await simple.add_events_and_save([
+        SessionEvent(
+            message="Hello! I have a question about quantum computing.",
+            source=EventSource.USER,
+        ),
+        SessionEvent(
+            message="Sure – what would you like to know?",
+            source=EventSource.LLM,
+        ),
+        SessionEvent(
+            message="Can you explain entanglement in simple terms?",
+            source=EventSource.USER,
+        ),
+        SessionEvent(
+            message="User asked about quantum computing & entanglement.",
+            source=EventSource.LLM,
+            type=EventType.SUMMARY,
+        ),
+    ])
     await describe_session(simple)
 
     # 2. hierarchy -----------------------------------------------------
     log.info("\n=== Building hierarchy ===")
 
+    # creation stays sequential: each child registers itself on its parent
     parent = await Session.create()
-    await parent.add_event_and_save(SessionEvent(
-        message="Let's discuss AI capabilities.",
-        source=EventSource.USER,
-    ))
-
     child_a = await Session.create(parent_id=parent.id)
-    await child_a.add_event_and_save(SessionEvent(
-        message="Tell me about language models.",
-        source=EventSource.USER,
-    ))
-
     child_b = await Session.create(parent_id=parent.id)
-    await child_b.add_event_and_save(SessionEvent(
-        message="Tell me about computer vision.",
-        source=EventSource.USER,
-    ))
-
     grand = await Session.create(parent_id=child_a.id)
-    await grand.add_event_and_save(SessionEvent(
-        message="How do transformers work?",
-        source=EventSource.USER,
-    ))
+
+    # the opening messages touch four different sessions – save them together
+    await asyncio.gather(
+        parent.add_event_and_save(SessionEvent(
+            message="Let's discuss AI capabilities.",
+            source=EventSource.USER,
+        )),
+        child_a.add_event_and_save(SessionEvent(
+            message="Tell me about language models.",
+            source=EventSource.USER,
+        )),
+        child_b.add_event_and_save(SessionEvent(
+            message="Tell me about computer vision.",
+            source=EventSource.USER,
+        )),
+        grand.add_event_and_save(SessionEvent(
+            message="How do transformers work?",
+            source=EventSource.USER,
+        )),
+    )
 
     log.info("grand-child ancestors:   %s", [a.id for a in await grand.ancestors()])
     log.info("parent     descendants: %s", [d.id for d in await parent.descendants()])
@@ -121,52 +128,54 @@ async def main() -> None:
     run_sess.runs.extend([run1, run2, run3])
 
     # run-specific events
-    await run_sess.add_event_and_save(SessionEvent(
-        message="Processing dataset 1",
-        source=EventSource.SYSTEM,
-        task_id=run1.id,
-    ))
-    await run_sess.add_event_and_save(SessionEvent(
-        message="Error on dataset 2",
-        source=EventSource.SYSTEM,
-        task_id=run2.id,
-    ))
-    await run_sess.add_event_and_save(SessionEvent(
-        message="Dataset 3 in progress",
-        source=EventSource.SYSTEM,
-        task_id=run3.id,
-    ))
+    await run_sess.add_events_and_save([
+        SessionEvent(
+            message="Processing dataset 1",
+            source=EventSource.SYSTEM,
+            task_id=run1.id,
+        ),
+        SessionEvent(
+            message="Error on dataset 2",
+            source=EventSource.SYSTEM,
+            task_id=run2.id,
+        ),
+        SessionEvent(
+            message="Dataset 3 in progress",
+            source=EventSource.SYSTEM,
+            task_id=run3.id,
+        ),
+    ])
     await describe_session(run_sess)
 
     # 4. prompt-builder demo ------------------------------------------
     log.info("\n=== Prompt-builder demo ===")
     tool_sess = await Session.create()
-    await tool_sess.add_event_and_save(SessionEvent(
-        message="What's the weather in New York?",
-        source=EventSource.USER,
-    ))
-
     assistant_evt = SessionEvent(
         message="I'll check that for you.",
         source=EventSource.LLM,
     )
-    await tool_sess.add_event_and_save(assistant_evt)
-
-    await tool_sess.add_event_and_save(SessionEvent(
-        message={
-            "tool_name": "get_weather",
-            "result": {"temperature": 72, "condition": "Sunny", "location": "New York"},
-        },
-        source=EventSource.SYSTEM,
-        type=EventType.TOOL_CALL,
-        metadata={"parent_event_id": assistant_evt.id},
-    ))
+    await tool_sess.add_events_and_save([
+        SessionEvent(
+            message="What's the weather in New York?",
+            source=EventSource.USER,
+        ),
+        assistant_evt,
+        SessionEvent(
+            message={
+                "tool_name": "get_weather",
+                "result": {"temperature": 72, "condition": "Sunny", "location": "New York"},
+            },
+            source=EventSource.SYSTEM,
+            type=EventType.TOOL_CALL,
+            metadata={"parent_event_id": assistant_evt.id},
+        ),
+    ])
 
     minimal = await build_prompt_from_session(tool_sess, PromptStrategy.MINIMAL)
     focused = await build_prompt_from_session(tool_sess, PromptStrategy.TOOL_FOCUSED)
 
-    log.info("\nMINIMAL strategy:\n%s", json_pretty(minimal))
-    log.info("\nTOOL_FOCUSED strategy:\n%s", json_pretty(focused))
+    log.info("\nMINIMAL strategy:\n%s", PrettyJson(minimal))
+    log.info("\nTOOL_FOCUSED strategy:\n%s", PrettyJson(focused))
 
     # 5. list sessions -------------------------------------------------
     log.info("\n=== Store contents ===")
@@ -175,11 +184,21 @@ async def main() -> None:
 
     log.info("\nAll done – async demo complete ✅")
 
-# tiny pretty-printer so we don’t need to import `json`
-def json_pretty(obj):  # noqa: D401
-    import json
-    return json.dumps(obj, indent=2, ensure_ascii=False)
+# lazy pretty-printer: the JSON is only rendered if the record is emitted
+class PrettyJson:
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return json.dumps(self.obj, indent=2, ensure_ascii=False)
 
 # ─────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # optional: faster event loop on Linux/macOS
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
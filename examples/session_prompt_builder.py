@@ -16,8 +16,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import re
 from typing import Any, Dict, List
 
+try:
+    import orjson  # optional: much faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
 # ── session imports ─────────────────────────────────────────────────────
 from chuk_session_manager.models.event_source import EventSource
 from chuk_session_manager.models.event_type import EventType
@@ -37,34 +43,68 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+
+class _LazyJson:
+    """Log argument that renders indented JSON only if the record is emitted."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __str__(self) -> str:
+        if orjson is not None:
+            return orjson.dumps(self.obj, default=str, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(self.obj, indent=2, ensure_ascii=False, default=str)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 # ── stub LLM & tool helpers ─────────────────────────────────────────
+# Canned replies, built once; keyword → reply that triggers a tool call
+_KEYWORD_REPLIES: Dict[str, Dict[str, Any]] = {
+    "weather": {
+        "role": "assistant",
+        "content": "Let me check the weather for you.",
+        "tool_calls": [
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_weather",
+                    "arguments": '{"location": "New York"}',
+                },
+            }
+        ],
+    },
+}
+_DEFAULT_REPLY: Dict[str, Any] = {
+    "role": "assistant",
+    "content": "This is a stubbed response from the fake LLM.",
+}
+# case-insensitive, so message text never needs lower-casing
+_KEYWORD_RE = re.compile("|".join(map(re.escape, _KEYWORD_REPLIES)), re.IGNORECASE)
+
+
 async def fake_llm(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Tiny stand-in for an LLM call that triggers a weather tool
     whenever the word “weather” appears in the prompt.
     """
-    prompt_txt = "\n".join(f"{m['role']}: {m.get('content')}" for m in messages)
-    log.info("LLM received %d msgs (%d chars)", len(messages), len(prompt_txt))
-
-    if "weather" in prompt_txt.lower():
-        return {
-            "role": "assistant",
-            "content": "Let me check the weather for you.",
-            "tool_calls": [
-                {
-                    "type": "function",
-                    "function": {
-                        "name": "get_weather",
-                        "arguments": json.dumps({"location": "New York"}),
-                    },
-                }
-            ],
-        }
-
-    return {
-        "role": "assistant",
-        "content": "This is a stubbed response from the fake LLM.",
-    }
+    if log.isEnabledFor(logging.INFO):
+        prompt_txt = "\n".join(f"{m['role']}: {m.get('content')}" for m in messages)
+        log.info("LLM received %d msgs (%d chars)", len(messages), len(prompt_txt))
+
+    # scan message by message and stop at the first keyword hit
+    for m in messages:
+        content = m.get("content")
+        if content is None:
+            continue
+        match = _KEYWORD_RE.search(content if isinstance(content, str) else str(content))
+        if match:
+            # shallow copy – callers treat nested tool_calls as read-only
+            return dict(_KEYWORD_REPLIES[match.group(0).lower()])
+    return dict(_DEFAULT_REPLY)
 
 
 async def execute_tool(name: str, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -76,6 +116,21 @@ async def execute_tool(name: str, args: Dict[str, Any]) -> Dict[str, Any]:
     return {"error": "unknown-tool"}
 
 
+# ── demo data (built once at import) ────────────────────────────────
+_CONVERSATION: tuple[tuple[str, str], ...] = (
+    ("user", "Tell me about quantum computing."),
+    ("assistant", "Quantum computers use qubits that can exist in superpositions."),
+    ("user", "How is that different from classical bits?"),
+    ("assistant", "Classical bits are strictly 0 or 1; qubits can be both."),
+    ("user", "What practical applications does it have?"),
+)
+_WEATHER_DATA: tuple[tuple[str, str], ...] = (
+    ("New York", "Sunny"),
+    ("Tokyo", "Rainy"),
+    ("London", "Cloudy"),
+)
+
+
 # ── individual strategy demos ───────────────────────────────────────
 async def demo_minimal() -> None:
     log.info("\n=== MINIMAL strategy ===")
@@ -90,27 +145,28 @@ async def demo_minimal() -> None:
     )
 
     prompt = await build_prompt_from_session(session, PromptStrategy.MINIMAL)
-    log.info("Prompt sent to LLM:\n%s", json.dumps(prompt, indent=2))
+    log.info("Prompt sent to LLM:\n%s", _LazyJson(prompt))
 
     llm_resp = await fake_llm(prompt)
 
-    # add assistant message
+    # assistant message plus one event per tool call, saved together
     assistant_evt = SessionEvent(
         message=llm_resp,
         source=EventSource.LLM,
         type=EventType.MESSAGE,
     )
-    await session.add_event_and_save(assistant_evt)
+    new_events = [assistant_evt]
 
     # run tool(s) if present
     for call in llm_resp.get("tool_calls", []):
         fn = call.get("function", {})
-        result = await execute_tool(fn.get("name"), json.loads(fn.get("arguments", "{}")))
-        await session.add_event_and_save(
+        args = _loads(fn.get("arguments", "{}"))  # decoded once, used twice
+        result = await execute_tool(fn.get("name"), args)
+        new_events.append(
             SessionEvent(
                 message={
                     "tool_name": fn.get("name"),
-                    "arguments": json.loads(fn.get("arguments", "{}")),
+                    "arguments": args,
                     "result": result,
                 },
                 source=EventSource.SYSTEM,
@@ -118,55 +174,44 @@ async def demo_minimal() -> None:
                 metadata={"parent_event_id": assistant_evt.id},
             )
         )
+    await session.add_events_and_save(new_events)
 
     prompt = await build_prompt_from_session(session, PromptStrategy.MINIMAL)
-    log.info("Prompt after tool execution:\n%s", json.dumps(prompt, indent=2))
+    log.info("Prompt after tool execution:\n%s", _LazyJson(prompt))
 
 
 async def demo_conversation() -> None:
     log.info("\n=== CONVERSATION strategy ===")
     session = await Session.create()
 
-    convo = [
-        ("user", "Tell me about quantum computing."),
-        ("assistant", "Quantum computers use qubits that can exist in superpositions."),
-        ("user", "How is that different from classical bits?"),
-        ("assistant", "Classical bits are strictly 0 or 1; qubits can be both."),
-        ("user", "What practical applications does it have?"),
-    ]
-    for role, msg in convo:
-        await session.add_event_and_save(
-            SessionEvent(
-                message=msg,
-                source=EventSource.USER if role == "user" else EventSource.LLM,
-                type=EventType.MESSAGE,
-            )
+    await session.add_events_and_save([
+        SessionEvent(
+            message=msg,
+            source=EventSource.USER if role == "user" else EventSource.LLM,
+            type=EventType.MESSAGE,
         )
+        for role, msg in _CONVERSATION
+    ])
 
     prompt = await build_prompt_from_session(session, PromptStrategy.CONVERSATION)
-    log.info("Conversation prompt:\n%s", json.dumps(prompt, indent=2))
+    log.info("Conversation prompt:\n%s", _LazyJson(prompt))
 
 
 async def demo_hierarchical() -> None:
     log.info("\n=== HIERARCHICAL strategy ===")
-    store = InMemorySessionStore()
-    SessionStoreProvider.set_store(store)
-
     parent = await Session.create()
-    await parent.add_event_and_save(
+    await parent.add_events_and_save([
         SessionEvent(
             message="Planning a trip to Japan.",
             source=EventSource.USER,
             type=EventType.MESSAGE,
-        )
-    )
-    await parent.add_event_and_save(
+        ),
         SessionEvent(
             message="User wants historical sites and nature.",
             source=EventSource.SYSTEM,
             type=EventType.SUMMARY,
-        )
-    )
+        ),
+    ])
     child = await Session.create(parent_id=parent.id)
     await child.add_event_and_save(
         SessionEvent(
@@ -181,28 +226,26 @@ async def demo_hierarchical() -> None:
         PromptStrategy.HIERARCHICAL,
         include_parent_context=True,
     )
-    log.info("Hierarchical prompt (with parent context):\n%s", json.dumps(prompt, indent=2))
+    log.info("Hierarchical prompt (with parent context):\n%s", _LazyJson(prompt))
 
 
 async def demo_tool_focused() -> None:
     log.info("\n=== TOOL_FOCUSED strategy ===")
     session = await Session.create()
-    await session.add_event_and_save(
-        SessionEvent(
-            message="Weather in New York, Tokyo and London?",
-            source=EventSource.USER,
-            type=EventType.MESSAGE,
-        )
-    )
     assistant_evt = SessionEvent(
         message="I'll check the weather.",
         source=EventSource.LLM,
         type=EventType.MESSAGE,
     )
-    await session.add_event_and_save(assistant_evt)
-
-    for city, cond in (("New York", "Sunny"), ("Tokyo", "Rainy"), ("London", "Cloudy")):
-        await session.add_event_and_save(
+    # question, assistant reply and every tool result – persisted with one save
+    await session.add_events_and_save([
+        SessionEvent(
+            message="Weather in New York, Tokyo and London?",
+            source=EventSource.USER,
+            type=EventType.MESSAGE,
+        ),
+        assistant_evt,
+        *(
             SessionEvent(
                 message={
                     "tool_name": "get_weather",
@@ -213,38 +256,42 @@ async def demo_tool_focused() -> None:
                 type=EventType.TOOL_CALL,
                 metadata={"parent_event_id": assistant_evt.id},
             )
-        )
+            for city, cond in _WEATHER_DATA
+        ),
+    ])
 
     prompt = await build_prompt_from_session(session, PromptStrategy.TOOL_FOCUSED)
-    log.info("Tool-focused prompt:\n%s", json.dumps(prompt, indent=2))
+    log.info("Tool-focused prompt:\n%s", _LazyJson(prompt))
 
 
 async def demo_token_truncation() -> None:
     log.info("\n=== token-limit truncation demo ===")
     session = await Session.create()
-    # make a long chat
+    # make a long chat – all 50 events built up front and saved once
+    events: List[SessionEvent] = []
     for i in range(25):
-        await session.add_event_and_save(
+        events.append(
             SessionEvent(
                 message=f"User message {i+1} … Lorem ipsum dolor sit amet.",
                 source=EventSource.USER,
                 type=EventType.MESSAGE,
             )
         )
-        await session.add_event_and_save(
+        events.append(
             SessionEvent(
                 message=f"Assistant response {i+1} … Dolor sit amet lorem ipsum.",
                 source=EventSource.LLM,
                 type=EventType.MESSAGE,
             )
         )
+    await session.add_events_and_save(events)
 
     full_prompt = await build_prompt_from_session(session, PromptStrategy.CONVERSATION)
     log.info("Full prompt has %d messages", len(full_prompt))
 
     truncated = await truncate_prompt_to_token_limit(full_prompt, max_tokens=500)
     log.info("After truncate_prompt_to_token_limit → %d messages", len(truncated))
-    log.info("First 3 truncated messages:\n%s", json.dumps(truncated[:3], indent=2))
+    log.info("First 3 truncated messages:\n%s", _LazyJson(truncated[:3]))
 
 
 # ── main orchestration ───────────────────────────────────────────────
@@ -252,14 +299,22 @@ async def main() -> None:
     log.info("Setting up in-memory store")
     SessionStoreProvider.set_store(InMemorySessionStore())
 
-    await demo_minimal()
-    await demo_conversation()
-    await demo_hierarchical()
-    await demo_tool_focused()
-    await demo_token_truncation()
+    # the demos build independent sessions in the shared store – run them together
+    await asyncio.gather(
+        demo_minimal(),
+        demo_conversation(),
+        demo_hierarchical(),
+        demo_tool_focused(),
+        demo_token_truncation(),
+    )
 
     log.info("All prompt-builder demos complete")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -15,7 +15,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 
 from chuk_session_manager.models.event_source import EventSource
 from chuk_session_manager.models.event_type   import EventType
@@ -34,6 +34,9 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+# (format, *args) log lines a demo collects while it runs concurrently
+LogLines = List[Tuple[Any, ...]]
+
 
 # ── helpers ──────────────────────────────────────────────────────────
 async def bootstrap_store() -> None:
@@ -72,9 +75,9 @@ async def token_usage_report(sess: Session) -> None:
 
 
 # ── demo 1: single-model conversation ───────────────────────────────
-async def create_basic_session() -> Session:
+async def create_basic_session(lines: LogLines) -> Session:
     sess = await Session.create()
-    log.info("Created session %s", sess.id)
+    lines.append(("Created session %s", sess.id))
 
     user_q = "Hello, can you explain quantum computing in simple terms?"
     await sess.add_event_and_save(
@@ -100,9 +103,9 @@ async def create_basic_session() -> Session:
 
 
 # ── demo 2: multi-model usage ───────────────────────────────────────
-async def create_multi_model_session() -> Session:
+async def create_multi_model_session(lines: LogLines) -> Session:
     sess = await Session.create()
-    log.info("Created multi-model session %s", sess.id)
+    lines.append(("Created multi-model session %s", sess.id))
 
     models = ["gpt-4", "gpt-3.5-turbo", "claude-3-sonnet"]
     for mdl in models:
@@ -126,9 +129,9 @@ async def create_multi_model_session() -> Session:
 
 
 # ── demo 3: running-total cost tracker ──────────────────────────────
-async def running_cost_demo() -> Session:
+async def running_cost_demo(lines: LogLines) -> Session:
     sess = await Session.create()
-    log.info("Created cost-tracking session %s", sess.id)
+    lines.append(("Created cost-tracking session %s", sess.id))
 
     convo: List[Dict[str, str]] = [
         {"role": "user", "content": "Plan a 3-day Kyoto trip."},
@@ -160,14 +163,14 @@ async def running_cost_demo() -> Session:
                 type=EventType.MESSAGE,
             )
             await sess.add_event_and_save(ev)
-            log.info(
+            lines.append((
                 "Added assistant msg (%s): %d tok, $%.6f → running total: %d tok, $%.6f",
                 mdl,
                 ev.token_usage.total_tokens,
                 ev.token_usage.estimated_cost_usd,
                 sess.total_tokens,
                 sess.total_cost,
-            )
+            ))
     return sess
 
 
@@ -182,17 +185,23 @@ async def main() -> None:
         "accurate counts" if TIKTOKEN_AVAILABLE else "using 4-chars≈1-token heuristic",
     )
 
-    basic = await create_basic_session()
-    await token_usage_report(basic)
-
-    multi = await create_multi_model_session()
-    await token_usage_report(multi)
-
-    costs = await running_cost_demo()
-    await token_usage_report(costs)
+    # the demos build independent sessions in the shared store, so run them
+    # concurrently; each collects its log lines, replayed with its report
+    demos = (create_basic_session, create_multi_model_session, running_cost_demo)
+    lines: List[LogLines] = [[] for _ in demos]
+    sessions = await asyncio.gather(*(demo(out) for demo, out in zip(demos, lines)))
+    for sess, demo_lines in zip(sessions, lines):
+        for msg, *args in demo_lines:
+            log.info(msg, *args)
+        await token_usage_report(sess)
 
     log.info("Token-tracking demo complete ✅")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
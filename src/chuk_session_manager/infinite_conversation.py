@@ -103,7 +103,7 @@ class InfiniteConversationManager:
         
         # Check if we've exceeded the token threshold
         if await self._should_create_new_segment(session):
-            logger.info(f"Token threshold exceeded for session {session_id}. Creating new segment.")
+            logger.info("Token threshold exceeded for session %s. Creating new segment.", session_id)
             
             # Create a summary of the current session
             summary = await self._create_summary(session, llm_callback)
@@ -140,7 +140,7 @@ class InfiniteConversationManager:
             return True
         
         # Check turn count
-        message_events = [e for e in session.events if e.type == EventType.MESSAGE]
+        message_events = session.events_by_type(EventType.MESSAGE)
         if len(message_events) >= self.max_turns_per_segment:
             return True
         
@@ -162,7 +162,7 @@ class InfiniteConversationManager:
             A summary string
         """
         # Get message events
-        message_events = [e for e in session.events if e.type == EventType.MESSAGE]
+        message_events = session.events_by_type(EventType.MESSAGE)
         
         # Create a conversation history for the LLM
         messages = []
@@ -173,7 +173,7 @@ class InfiniteConversationManager:
         
         # Add the conversation history
         for event in message_events:
-            role = "user" if event.source == EventSource.USER else "assistant"
+            role = "user" if event.source is EventSource.USER else "assistant"
             content = event.message
             messages.append({"role": role, "content": content})
         
@@ -240,7 +240,7 @@ class InfiniteConversationManager:
             summaries = []
             for ancestor in ancestors:
                 summary_event = next(
-                    (e for e in reversed(ancestor.events) if e.type == EventType.SUMMARY),
+                    (e for e in reversed(ancestor.events) if e.type is EventType.SUMMARY),
                     None
                 )
                 if summary_event:
@@ -254,12 +254,12 @@ class InfiniteConversationManager:
                 })
         
         # Get recent messages from the current session
-        message_events = [e for e in session.events if e.type == EventType.MESSAGE]
+        message_events = session.events_by_type(EventType.MESSAGE)
         recent_messages = message_events[-max_messages:] if len(message_events) > max_messages else message_events
         
         # Add messages to context
         for event in recent_messages:
-            role = "user" if event.source == EventSource.USER else "assistant"
+            role = "user" if event.source is EventSource.USER else "assistant"
             content = event.message
             context.append({"role": role, "content": content})
         
@@ -305,11 +305,11 @@ class InfiniteConversationManager:
         # Process each session in the chain
         for session in sessions:
             # Get message events from this session
-            message_events = [e for e in session.events if e.type == EventType.MESSAGE]
+            message_events = session.events_by_type(EventType.MESSAGE)
             
             # Add to history
             for event in message_events:
-                role = "user" if event.source == EventSource.USER else "assistant"
+                role = "user" if event.source is EventSource.USER else "assistant"
                 content = event.message
                 history.append((role, event.source, content))
         
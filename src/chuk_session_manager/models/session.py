@@ -4,7 +4,7 @@ Session model for the chuk session manager with improved async support.
 """
 from __future__ import annotations
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Generic, TypeVar, Union
+from typing import Any, Dict, Iterable, List, Optional, Generic, TypeVar, Union
 from uuid import uuid4
 from pydantic import BaseModel, Field, model_validator
 import asyncio
@@ -12,6 +12,7 @@ import asyncio
 # Import models that Session depends on
 from chuk_session_manager.models.session_metadata import SessionMetadata
 from chuk_session_manager.models.session_event import SessionEvent
+from chuk_session_manager.models.event_type import EventType
 from chuk_session_manager.models.token_usage import TokenUsage, TokenSummary
 # Import SessionRun and RunStatus directly to avoid circular import
 from chuk_session_manager.models.session_run import SessionRun, RunStatus
@@ -152,6 +153,21 @@ class Session(BaseModel, Generic[MessageT]):
         if event.token_usage:
             await self.token_summary.add_usage(event.token_usage)
     
+    async def add_events(self, events: Iterable[SessionEvent[MessageT]]) -> None:
+        """
+        Add several events to the session and update token tracking asynchronously.
+        
+        Args:
+            events: The events to add, in order
+        """
+        events = list(events)
+        self.events.extend(events)
+        
+        # Update token summary for events that carry token usage
+        for event in events:
+            if event.token_usage:
+                await self.token_summary.add_usage(event.token_usage)
+    
     async def add_event_and_save(self, event: SessionEvent[MessageT]) -> None:
         """
         Add an event to the session, update token tracking, and save the session.
@@ -167,6 +183,33 @@ class Session(BaseModel, Generic[MessageT]):
         store = SessionStoreProvider.get_store()
         await store.save(self)
     
+    async def add_events_and_save(self, events: Iterable[SessionEvent[MessageT]]) -> None:
+        """
+        Add several events to the session and save the session once.
+        
+        Args:
+            events: The events to add, in order
+        """
+        # Add the events asynchronously
+        await self.add_events(events)
+        
+        # Save the session with a single store round-trip
+        from chuk_session_manager.storage import SessionStoreProvider
+        store = SessionStoreProvider.get_store()
+        await store.save(self)
+    
+    def events_by_type(self, *types: EventType) -> List[SessionEvent[MessageT]]:
+        """
+        Return the events of the given types, in session order.
+        
+        Args:
+            types: One or more event types to select
+        """
+        if len(types) == 1:
+            wanted = types[0]
+            return [e for e in self.events if e.type is wanted]
+        return [e for e in self.events if e.type in types]
+    
     async def get_token_usage_by_source(self) -> Dict[str, TokenSummary]:
         """
         Get token usage statistics grouped by event source asynchronously.
@@ -7,6 +7,7 @@ with proper async support.
 """
 from __future__ import annotations
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Optional, Union, List, Any
 from uuid import uuid4
 from pydantic import BaseModel, Field, ConfigDict
@@ -20,6 +21,19 @@ except ImportError:
     TIKTOKEN_AVAILABLE = False
 
 
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """
+    Return the tiktoken encoding for a model, cached per process.
+    
+    Falls back to cl100k_base if tiktoken does not know the model.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except (KeyError, ValueError):
+        return tiktoken.get_encoding("cl100k_base")
+
+
 class TokenUsage(BaseModel):
     """
     Tracks token usage for LLM interactions.
@@ -88,9 +102,8 @@ class TokenUsage(BaseModel):
         Returns:
             Estimated cost in USD
         """
-        # Token calculation is CPU-bound, so run in executor
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._calculate_cost_sync)
+        # Token calculation is CPU-bound, so run in a worker thread
+        return await asyncio.to_thread(self._calculate_cost_sync)
     
     def _update_sync(self, prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
         """
@@ -167,21 +180,20 @@ class TokenUsage(BaseModel):
         Returns:
             A TokenUsage instance with token counts
         """
-        # Run token counting in executor since it's CPU-bound
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None, 
-            lambda: cls._from_text_sync(prompt, completion, model)
-        )
+        # Run token counting in a worker thread since it's CPU-bound
+        return await asyncio.to_thread(cls._from_text_sync, prompt, completion, model)
     
     @staticmethod
-    def _count_tokens_sync(text: Optional[str], model: str = "gpt-3.5-turbo") -> int:
+    def _count_tokens_sync(
+        text: Optional[str], model: str = "gpt-3.5-turbo", *, round_up: bool = False
+    ) -> int:
         """
         Synchronous implementation of count_tokens.
         
         Args:
             text: The text to count tokens for
             model: The model name to use for counting
+            round_up: Round the ~4-chars-per-token approximation up, not down
             
         Returns:
             The number of tokens
@@ -191,18 +203,14 @@ class TokenUsage(BaseModel):
             
         if TIKTOKEN_AVAILABLE:
             try:
-                encoding = tiktoken.encoding_for_model(model)
-                return len(encoding.encode(text))
-            except (KeyError, ValueError):
-                # Fall back to cl100k_base encoding if the model is not found
-                try:
-                    encoding = tiktoken.get_encoding("cl100k_base")
-                    return len(encoding.encode(text))
-                except Exception:
-                    # If all else fails, use the approximation
-                    pass
+                return len(_get_encoding(model).encode(text))
+            except Exception:
+                # If all else fails, use the approximation
+                pass
         
         # Simple approximation: ~4 chars per token for English text
+        if round_up:
+            return -(-len(text) // 4)
         return int(len(text) / 4)
     
     @staticmethod
@@ -217,11 +225,30 @@ class TokenUsage(BaseModel):
         Returns:
             The number of tokens
         """
-        # Run in executor since token counting is CPU-bound
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: TokenUsage._count_tokens_sync(text, model)
+        # Run in a worker thread since token counting is CPU-bound
+        return await asyncio.to_thread(TokenUsage._count_tokens_sync, text, model)
+
+    @staticmethod
+    async def count_tokens_batch(
+        texts: List[Optional[str]], model: str = "gpt-3.5-turbo", *, round_up: bool = False
+    ) -> List[int]:
+        """
+        Count tokens for several texts with a single worker-thread hop.
+        
+        Args:
+            texts: The texts to count tokens for
+            model: The model name to use for counting
+            round_up: Round the approximation up, so per-text counts never sum
+                to less than the count of the texts joined together
+            
+        Returns:
+            The number of tokens of each text, in order
+        """
+        return await asyncio.to_thread(
+            lambda: [
+                TokenUsage._count_tokens_sync(text, model, round_up=round_up)
+                for text in texts
+            ]
         )
     
     def __add__(self, other: TokenUsage) -> TokenUsage:
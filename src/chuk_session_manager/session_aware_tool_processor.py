@@ -14,19 +14,107 @@ import asyncio
 import hashlib
 import json
 import logging
-from typing import Any, Dict, List
+import random
+import time
+from collections import OrderedDict
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Protocol, Set, Tuple,
+)
+
+# Try to import orjson, but make it optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from chuk_tool_processor.core.processor import ToolProcessor
 from chuk_tool_processor.models.tool_call import ToolCall
 from chuk_tool_processor.models.tool_result import ToolResult
+from pydantic import BaseModel
 
 from chuk_session_manager.models.event_source import EventSource
 from chuk_session_manager.models.event_type import EventType
 from chuk_session_manager.models.session_event import SessionEvent
-from chuk_session_manager.storage import SessionStoreProvider
+from chuk_session_manager.storage import SessionStoreInterface, SessionStoreProvider
 
 logger = logging.getLogger(__name__)
 
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _parse_arguments(raw: Any) -> Any:
+    """Decode tool-call arguments; already-decoded dicts pass straight through."""
+    if isinstance(raw, dict):
+        return raw
+    try:
+        return _json_loads(raw)
+    except json.JSONDecodeError:
+        return {"raw": raw}
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialise *obj* to compact JSON, via orjson when available.
+
+    Both paths use compact separators and raw UTF-8, so the recorded
+    strings (and their token counts) match for typical payloads; some
+    floats still differ (``1e16`` vs ``1e+16``, NaN as ``null`` vs ``NaN``).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class CachePolicy(BaseModel):
+    """Per-tool caching rules."""
+    cacheable: bool = True
+    ttl: Optional[float] = None  # seconds; None means no expiry
+
+
+class ToolResultCache:
+    """Bounded LRU cache of tool results with optional per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, Tuple[ToolResult, Optional[float]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[ToolResult]:
+        """Return the cached result, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        res, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return res
+
+    def set(self, key: str, res: ToolResult, ttl: Optional[float] = None) -> None:
+        """Store *res*, evicting the least recently used entries past the bound."""
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (res, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class ToolCacheBackend(Protocol):
+    """Shared (cross-process) second-level cache for tool results."""
+
+    async def get(self, key: str) -> Optional[ToolResult]: ...
+
+    async def set(self, key: str, res: ToolResult, ttl: Optional[float] = None) -> None: ...
+
 
 class SessionAwareToolProcessor:
     """Run tool-calls, add retry/caching, and log into a session."""
@@ -39,25 +127,81 @@ class SessionAwareToolProcessor:
         enable_caching: bool = True,
         max_retries: int = 2,
         retry_delay: float = 1.0,
+        retry_max: float = 30.0,
+        retry_jitter: bool = True,
+        max_cache_entries: int = 1024,
+        cache_ttl: Optional[float] = None,
+        cache_policies: Optional[Dict[str, CachePolicy]] = None,
+        store: Optional[SessionStoreInterface] = None,
+        shared_cache: Optional[ToolCacheBackend] = None,
+        canonicalizers: Optional[Dict[str, Callable[[Any], Any]]] = None,
+        log_cache_hits: bool = True,
+        tool_processor: Optional[ToolProcessor] = None,
     ) -> None:
         self.session_id     = session_id
         self.enable_caching = enable_caching
         self.max_retries    = max_retries
         self.retry_delay    = retry_delay
-        self.cache: Dict[str, ToolResult] = {}
+        self.retry_max      = retry_max
+        self.retry_jitter   = retry_jitter
+        self.cache          = ToolResultCache(max_cache_entries)
+        self.cache_policies = cache_policies or {}
+        self._default_policy = CachePolicy(ttl=cache_ttl)
+        self.shared_cache   = shared_cache
+        # per-tool argument normalisers applied before cache-key hashing
+        self.canonicalizers = canonicalizers or {}
+        # False → cache hits are listed on the parent MESSAGE event instead
+        # of each getting a TOOL_CALL event of its own
+        self.log_cache_hits = log_cache_hits
+        # keeps fire-and-forget shared-cache writes alive until they finish
+        self._background: Set[asyncio.Task] = set()
+        # cache_key → result future of the call currently executing it
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # resolve the store once rather than on every message
+        self._store = store or SessionStoreProvider.get_store()
 
-        self._tp = ToolProcessor()
+        # pass one ToolProcessor in to share it between several processors
+        self._tp = tool_processor or ToolProcessor()
         if not hasattr(self._tp, "executor"):
             raise AttributeError("Installed chuk_tool_processor is too old – missing `.executor`")
+        # executor entry point, resolved on first use and reused afterwards
+        self._execute: Optional[Callable[..., Awaitable[List[ToolResult]]]] = None
 
     @classmethod
     async def create(cls, session_id: str, **kwargs):
-        store = SessionStoreProvider.get_store()
+        store = kwargs.get("store") or SessionStoreProvider.get_store()
         if not await store.get(session_id):
             raise ValueError(f"Session {session_id} not found")
         return cls(session_id=session_id, **kwargs)
 
     # ─────────────────────────── internals ─────────────────────────────
+    @staticmethod
+    def _cache_key(name: str, args: Any) -> str:
+        """Stable key for a (tool, arguments) pair.
+
+        Arguments are serialised canonically (sorted keys, compact separators,
+        raw UTF-8) – with orjson when available – and hashed with BLAKE2b;
+        no cryptographic strength needed. Both serializers agree on strings,
+        ints, bools and null, but not on every float (``1e16`` vs ``1e+16``,
+        NaN as ``null`` vs ``NaN``), so keys are only guaranteed stable for
+        processors using the same serializer – keep that in mind when
+        several deployments share one ``shared_cache``.
+        """
+        payload: bytes | None = None
+        if ORJSON_AVAILABLE:
+            try:
+                payload = orjson.dumps(args, option=orjson.OPT_SORT_KEYS)
+            except TypeError:
+                payload = None
+        if payload is None:
+            payload = json.dumps(
+                args, sort_keys=True, separators=(",", ":"),
+                ensure_ascii=False, default=str,
+            ).encode()
+        return hashlib.blake2b(
+            name.encode() + b"\0" + payload, digest_size=16
+        ).hexdigest()
+
     async def _maybe_await(self, val: Any) -> Any:
         return await val if asyncio.iscoroutine(val) else val
 
@@ -67,31 +211,41 @@ class SessionAwareToolProcessor:
         for c in calls:
             fn   = c.get("function", {})
             name = fn.get("name", "tool")
-            try:
-                args = json.loads(fn.get("arguments", "{}"))
-            except json.JSONDecodeError:
-                args = {"raw": fn.get("arguments")}
+            args = _parse_arguments(fn.get("arguments", "{}"))
             tool_calls.append(ToolCall(tool=name, arguments=args))
 
-        results = await self._tp.executor.execute(tool_calls)
+        execute = self._execute
+        if execute is None:
+            execute = self._execute = self._tp.executor.execute
+        results = await execute(tool_calls)
         for r in results:
             r.result = await self._maybe_await(r.result)
         return results
 
-    async def _log_event(
+    async def _tool_event(
         self,
-        session,
         parent_id: str,
         res: ToolResult,
         attempt: int,
         *,
         cached: bool,
         failed: bool = False,
-    ) -> None:
-        """Persist TOOL_CALL with *string* result (prompt-friendly)."""
+        coalesced: bool = False,
+    ) -> SessionEvent:
+        """Build the TOOL_CALL event with *string* result (prompt-friendly)."""
         result_str = str(res.result) if res.result is not None else "null"
 
-        ev = await SessionEvent.create_with_tokens(
+        metadata = {
+            "parent_event_id": parent_id,
+            "call_id":         getattr(res, "id", "cid"),
+            "attempt":         attempt,
+        }
+        if failed:
+            metadata["failed"] = True
+        if coalesced:
+            metadata["coalesced"] = True
+
+        return await SessionEvent.create_with_tokens(
             message={
                 "tool":      res.tool,
                 "arguments": getattr(res, "arguments", None),
@@ -99,80 +253,231 @@ class SessionAwareToolProcessor:
                 "error":     res.error,
                 "cached":    cached,
             },
-            prompt=f"{res.tool}({json.dumps(getattr(res, 'arguments', None), default=str)})",
+            prompt=f"{res.tool}({_json_dumps(getattr(res, 'arguments', None))})",
             completion=result_str,
             model="tool-execution",
             source=EventSource.SYSTEM,
             type=EventType.TOOL_CALL,
+            metadata=metadata,
         )
-        await ev.update_metadata("parent_event_id", parent_id)
-        await ev.update_metadata("call_id", getattr(res, "id", "cid"))
-        await ev.update_metadata("attempt", attempt)
-        if failed:
-            await ev.update_metadata("failed", True)
-        await session.add_event_and_save(ev)
 
-    # ─────────────────────────── public API ────────────────────────────
-    async def process_llm_message(self, llm_msg: Dict[str, Any], _) -> List[ToolResult]:
-        store   = SessionStoreProvider.get_store()
-        session = await store.get(self.session_id)
+    async def _process_one_call(
+        self, parent_id: str, call: Dict[str, Any]
+    ) -> Tuple[ToolResult, Optional[SessionEvent]]:
+        """Cache lookup and execution with retry for one tool-call.
+
+        Returns the result together with its (not yet saved) TOOL_CALL event,
+        or ``None`` in place of the event for an unlogged cache hit.
+        """
+        fn   = call.get("function", {})
+        name = fn.get("name", "tool")
+        args = _parse_arguments(fn.get("arguments", "{}"))
+
+        policy    = self.cache_policies.get(name, self._default_policy)
+        cache_key = None
+        if self.enable_caching and policy.cacheable:
+            canonicalize = self.canonicalizers.get(name)
+            cache_key = self._cache_key(name, canonicalize(args) if canonicalize else args)
+
+        # 1) cache hit (local, then shared) -----------------------------
+        if cache_key and (cached := await self._cache_lookup(cache_key, policy)):
+            if not self.log_cache_hits:
+                return cached, None
+            return cached, await self._tool_event(parent_id, cached, 1, cached=True)
+
+        # 2) identical call already running – share its outcome ---------
+        while cache_key and (pending := self._inflight.get(cache_key)):
+            try:
+                res = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # only our own cancellation propagates; if the owning call
+                # was cancelled instead, take the call over (or join a new flight)
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                continue
+            failed = res.error is not None
+            if not failed and not self.log_cache_hits:
+                return res, None
+            # failures are never cached, so a shared failure is not a cache hit
+            return res, await self._tool_event(
+                parent_id, res, 1, cached=not failed, failed=failed, coalesced=True
+            )
+
+        # 3) execute with retry ----------------------------------------
+        flight: Optional[asyncio.Future] = None
+        if cache_key:
+            flight = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = flight
+        try:
+            res, attempt, failed = await self._run_with_retry(name, call)
+        except BaseException:
+            if flight:
+                flight.cancel()
+            raise
+        finally:
+            if cache_key:
+                del self._inflight[cache_key]
+
+        if flight:
+            flight.set_result(res)
+        if cache_key and not failed:
+            self.cache.set(cache_key, res, policy.ttl)
+            if self.shared_cache is not None:
+                task = asyncio.create_task(self._shared_cache_set(cache_key, res, policy.ttl))
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+        return res, await self._tool_event(
+            parent_id, res, attempt, cached=False, failed=failed
+        )
+
+    async def _cache_lookup(self, key: str, policy: CachePolicy) -> Optional[ToolResult]:
+        """Check the local LRU, then the shared backend (promoting hits)."""
+        if (res := self.cache.get(key)) is not None:
+            return res
+        if self.shared_cache is None:
+            return None
+        try:
+            res = await self.shared_cache.get(key)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Shared tool cache lookup failed: %s", exc)
+            return None
+        if res is not None:
+            self.cache.set(key, res, policy.ttl)
+        return res
+
+    async def _shared_cache_set(self, key: str, res: ToolResult, ttl: Optional[float]) -> None:
+        try:
+            await self.shared_cache.set(key, res, ttl)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Shared tool cache write failed: %s", exc)
+
+    def _backoff(self, attempt: int) -> float:
+        """Delay before retrying after failed *attempt* (1-based).
+
+        Exponential from ``retry_delay`` and capped at ``retry_max``; with
+        ``retry_jitter`` it is scaled by a random factor in [0.5, 1.5) so
+        concurrent retries do not hit the upstream in lock-step.
+        """
+        delay = min(self.retry_max, self.retry_delay * 2 ** (attempt - 1))
+        if self.retry_jitter:
+            delay *= random.uniform(0.5, 1.5)
+        return delay
+
+    async def _run_with_retry(
+        self, name: str, call: Dict[str, Any]
+    ) -> Tuple[ToolResult, int, bool]:
+        """Execute one tool-call, retrying on errors.
+
+        Returns ``(result, attempt, failed)``; after the last failed attempt
+        the result carries the error instead of raising.
+        """
+        last_err: str | None = None
+        for attempt in range(1, self.max_retries + 2):
+            try:
+                return (await self._exec_calls([call]))[0], attempt, False
+            except Exception as exc:  # noqa: BLE001
+                last_err = str(exc)
+                if attempt <= self.max_retries:
+                    await asyncio.sleep(self._backoff(attempt))
+
+        err_res = ToolResult(tool=name, result=None, error=last_err)  # type: ignore[arg-type]
+        return err_res, self.max_retries + 1, True
+
+    async def _open_message(self, llm_msg: Dict[str, Any]):
+        """Load the session and build the (unsaved) MESSAGE event for *llm_msg*."""
+        session = await self._store.get(self.session_id)
         if not session:
             raise ValueError(f"Session {self.session_id} not found")
 
         parent_evt = await SessionEvent.create_with_tokens(
             message=llm_msg,
             prompt="",
-            completion=json.dumps(llm_msg, ensure_ascii=False),
+            completion=_json_dumps(llm_msg),
             model="gpt-4o-mini",
             source=EventSource.LLM,
             type=EventType.MESSAGE,
         )
-        await session.add_event_and_save(parent_evt)
+        return session, parent_evt
+
+    async def _save_events(
+        self,
+        session,
+        parent_evt: SessionEvent,
+        calls: List[Dict[str, Any]],
+        events: List[Optional[SessionEvent]],
+    ) -> None:
+        """Append the message and its tool events to *session*; save once.
+
+        *events* line up with *calls*; ``None`` entries are unlogged cache
+        hits and are summarised on the parent event's metadata.
+        """
+        cached_calls = [
+            {"call_id": call.get("id", "cid"), "tool": call.get("function", {}).get("name", "tool")}
+            for call, ev in zip(calls, events)
+            if ev is None
+        ]
+        if cached_calls:
+            parent_evt.metadata["cached_calls"] = cached_calls
+        await session.add_events([parent_evt, *(ev for ev in events if ev is not None)])
+        await self._store.save(session)
+
+    # ─────────────────────────── public API ────────────────────────────
+    async def process_llm_message(self, llm_msg: Dict[str, Any], _) -> List[ToolResult]:
+        session, parent_evt = await self._open_message(llm_msg)
 
         calls = llm_msg.get("tool_calls", [])
         if not calls:
+            await self._save_events(session, parent_evt, [], [])
             return []
 
-        out: list[ToolResult] = []
-        for call in calls:
-            fn   = call.get("function", {})
-            name = fn.get("name", "tool")
-            try:
-                args = json.loads(fn.get("arguments", "{}"))
-            except json.JSONDecodeError:
-                args = {"raw": fn.get("arguments")}
+        # independent calls run concurrently; gather keeps the input order
+        done = await asyncio.gather(
+            *(self._process_one_call(parent_evt.id, call) for call in calls)
+        )
 
-            cache_key = (
-                hashlib.md5(f"{name}:{json.dumps(args, sort_keys=True)}".encode()).hexdigest()
-                if self.enable_caching else None
-            )
+        # persist the message and all of its TOOL_CALL events with one save
+        await self._save_events(session, parent_evt, calls, [ev for _, ev in done])
+        return [res for res, _ in done]
 
-            # 1) cache hit --------------------------------------------------
-            if cache_key and (cached := self.cache.get(cache_key)):
-                await self._log_event(session, parent_evt.id, cached, 1, cached=True)
-                out.append(cached)
-                continue
+    async def process_llm_message_stream(
+        self, llm_msg: Dict[str, Any], _
+    ) -> AsyncIterator[ToolResult]:
+        """Like :meth:`process_llm_message`, but yield results as they finish.
 
-            # 2) execute with retry ----------------------------------------
-            last_err: str | None = None
-            for attempt in range(1, self.max_retries + 2):
-                try:
-                    res = (await self._exec_calls([call]))[0]
-                    if cache_key:
-                        self.cache[cache_key] = res
-                    await self._log_event(session, parent_evt.id, res, attempt, cached=False)
-                    out.append(res)
-                    break
-                except Exception as exc:  # noqa: BLE001
-                    last_err = str(exc)
-                    if attempt <= self.max_retries:
-                        await asyncio.sleep(self.retry_delay)
-                        continue
-                    err_res = ToolResult(tool=name, result=None, error=last_err)  # type: ignore[arg-type]
-                    await self._log_event(
-                        session, parent_evt.id, err_res, attempt,
-                        cached=False, failed=True
-                    )
-                    out.append(err_res)
-
-        return out
+        Results arrive in completion order so a caller can start on fast
+        tools while slow ones are still running. Events are saved in one
+        go, in tool_calls order, once the stream is exhausted or closed;
+        calls still running when the stream is closed are cancelled.
+
+        Callers that may stop early must close the stream explicitly,
+        e.g. ``async with contextlib.aclosing(proc.process_llm_message_stream(...))``;
+        a stream abandoned with ``break`` is only saved when it is
+        garbage-collected, which may never happen before the loop shuts down.
+        """
+        session, parent_evt = await self._open_message(llm_msg)
+
+        calls = llm_msg.get("tool_calls", [])
+        tasks = [
+            asyncio.create_task(self._process_one_call(parent_evt.id, call))
+            for call in calls
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                res, _ = await next_done
+                yield res
+        finally:
+            for task in tasks:
+                task.cancel()
+            # let cancelled calls unwind (and release their in-flight keys)
+            await asyncio.gather(*tasks, return_exceptions=True)
+            finished = [
+                (call, task.result()[1])
+                for call, task in zip(calls, tasks)
+                if task.done() and not task.cancelled() and task.exception() is None
+            ]
+            await self._save_events(
+                session,
+                parent_evt,
+                [call for call, _ in finished],
+                [ev for _, ev in finished],
+            )
@@ -12,7 +12,6 @@ import json
 import logging
 from typing import List, Dict, Any, Optional, Literal, Union
 from enum import Enum
-import asyncio 
 
 from chuk_session_manager.models.session import Session
 from chuk_session_manager.models.event_type import EventType
@@ -61,7 +60,7 @@ async def build_prompt_from_session(
         try:
             strategy = PromptStrategy(strategy)
         except ValueError:
-            logger.warning(f"Unknown strategy '{strategy}', falling back to MINIMAL")
+            logger.warning("Unknown strategy '%s', falling back to MINIMAL", strategy)
             strategy = PromptStrategy.MINIMAL
     
     # Use the appropriate strategy
@@ -95,7 +94,7 @@ async def _build_minimal_prompt(session: Session) -> List[Dict[str, str]]:
         (
             e
             for e in session.events
-            if e.type == EventType.MESSAGE and e.source == EventSource.USER
+            if e.type is EventType.MESSAGE and e.source is EventSource.USER
         ),
         None,
     )
@@ -105,7 +104,7 @@ async def _build_minimal_prompt(session: Session) -> List[Dict[str, str]]:
         (
             ev
             for ev in reversed(session.events)
-            if ev.type == EventType.MESSAGE and ev.source != EventSource.USER
+            if ev.type is EventType.MESSAGE and ev.source is not EventSource.USER
         ),
         None,
     )
@@ -120,8 +119,8 @@ async def _build_minimal_prompt(session: Session) -> List[Dict[str, str]]:
         for e in session.events
         if e.metadata.get("parent_event_id") == assistant_msg.id
     ]
-    tool_calls = [c for c in children if c.type == EventType.TOOL_CALL]
-    summaries = [c for c in children if c.type == EventType.SUMMARY]
+    tool_calls = [c for c in children if c.type is EventType.TOOL_CALL]
+    summaries = [c for c in children if c.type is EventType.SUMMARY]
 
     # Assemble prompt
     prompt: List[Dict[str, str]] = []
@@ -178,7 +177,7 @@ async def _build_task_focused_prompt(session: Session) -> List[Dict[str, str]]:
     # Get first and most recent user messages
     user_messages = [
         e for e in session.events
-        if e.type == EventType.MESSAGE and e.source == EventSource.USER
+        if e.type is EventType.MESSAGE and e.source is EventSource.USER
     ]
     
     if not user_messages:
@@ -192,7 +191,7 @@ async def _build_task_focused_prompt(session: Session) -> List[Dict[str, str]]:
         (
             ev
             for ev in reversed(session.events)
-            if ev.type == EventType.MESSAGE and ev.source != EventSource.USER
+            if ev.type is EventType.MESSAGE and ev.source is not EventSource.USER
         ),
         None,
     )
@@ -222,7 +221,7 @@ async def _build_task_focused_prompt(session: Session) -> List[Dict[str, str]]:
             e for e in session.events
             if e.metadata.get("parent_event_id") == assistant_msg.id
         ]
-        tool_calls = [c for c in children if c.type == EventType.TOOL_CALL]
+        tool_calls = [c for c in children if c.type is EventType.TOOL_CALL]
         
         # Only include successful tool results
         for tc in tool_calls:
@@ -256,7 +255,7 @@ async def _build_tool_focused_prompt(session: Session) -> List[Dict[str, str]]:
     # Get the latest user message
     latest_user = next(
         (e for e in reversed(session.events) 
-         if e.type == EventType.MESSAGE and e.source == EventSource.USER),
+         if e.type is EventType.MESSAGE and e.source is EventSource.USER),
         None
     )
     
@@ -266,7 +265,7 @@ async def _build_tool_focused_prompt(session: Session) -> List[Dict[str, str]]:
     # Get the latest assistant message
     assistant_msg = next(
         (ev for ev in reversed(session.events)
-         if ev.type == EventType.MESSAGE and ev.source != EventSource.USER),
+         if ev.type is EventType.MESSAGE and ev.source is not EventSource.USER),
         None
     )
     
@@ -288,7 +287,7 @@ async def _build_tool_focused_prompt(session: Session) -> List[Dict[str, str]]:
             e for e in session.events
             if e.metadata.get("parent_event_id") == assistant_msg.id
         ]
-        tool_calls = [c for c in children if c.type == EventType.TOOL_CALL]
+        tool_calls = [c for c in children if c.type is EventType.TOOL_CALL]
         
         # Add all tool calls with status information
         for tc in tool_calls:
@@ -326,7 +325,7 @@ async def _build_conversation_prompt(
     # Get relevant message events
     message_events = [
         e for e in session.events
-        if e.type == EventType.MESSAGE
+        if e.type is EventType.MESSAGE
     ]
     
     # Take the most recent messages
@@ -335,7 +334,7 @@ async def _build_conversation_prompt(
     # Build the conversation history
     prompt = []
     for msg in recent_messages:
-        role = "user" if msg.source == EventSource.USER else "assistant"
+        role = "user" if msg.source is EventSource.USER else "assistant"
         content = msg.message
         
         # Handle different message formats
@@ -343,13 +342,13 @@ async def _build_conversation_prompt(
             content = content["content"]
         
         # For the last assistant message, set content to None
-        if role == "assistant" and msg == recent_messages[-1] and msg.source != EventSource.USER:
+        if role == "assistant" and msg == recent_messages[-1] and msg.source is not EventSource.USER:
             content = None
             
             # Add tool call results for this assistant message
             tool_calls = [
                 e for e in session.events
-                if e.type == EventType.TOOL_CALL and e.metadata.get("parent_event_id") == msg.id
+                if e.type is EventType.TOOL_CALL and e.metadata.get("parent_event_id") == msg.id
             ]
             
             # Add the message first, then tools
@@ -398,7 +397,7 @@ async def _build_hierarchical_prompt(
             # Find the most recent summary in parent
             summary_event = next(
                 (e for e in reversed(parent.events) 
-                 if e.type == EventType.SUMMARY),
+                 if e.type is EventType.SUMMARY),
                 None
             )
             
@@ -437,11 +436,15 @@ async def truncate_prompt_to_token_limit(
         return []
 
     # ------------------------------------------------------------------ #
-    # quick overall count
-    text = "\n".join(f"{m.get('role', 'unknown')}: {m.get('content') or ''}" for m in prompt)
-    total = TokenUsage.count_tokens(text, model)
-    total = await total if asyncio.iscoroutine(total) else total
-    if total <= max_tokens:
+    # count every message once; both checks below just add these up.
+    # Each text carries its "\n" separator and the approximation rounds up,
+    # so the sums never undercount the joined prompt.
+    counts = await TokenUsage.count_tokens_batch(
+        [f"{m.get('role', 'unknown')}: {m.get('content') or ''}\n" for m in prompt],
+        model,
+        round_up=True,
+    )
+    if sum(counts) <= max_tokens:
         return prompt
 
     # ------------------------------------------------------------------ #
@@ -452,16 +455,16 @@ async def truncate_prompt_to_token_limit(
         None,
     )
 
-    kept: List[Dict[str, str]] = []
+    kept_idx: List[int] = []
     if first_user_idx is not None:
-        kept.append(prompt[first_user_idx])
+        kept_idx.append(first_user_idx)
     if last_asst_idx is not None:
-        kept.extend(prompt[last_asst_idx:])
+        kept_idx.extend(range(last_asst_idx, len(prompt)))
+    kept: List[Dict[str, str]] = [prompt[i] for i in kept_idx]
 
     # ------------------------------------------------------------------ #
-    # re-count and maybe drop / add tool messages
-    remaining = TokenUsage.count_tokens(str(kept), model)
-    remaining = await remaining if asyncio.iscoroutine(remaining) else remaining
+    # re-count (from the cached per-message counts) and maybe drop / add tool messages
+    remaining = sum(counts[i] for i in kept_idx)
 
     if remaining > max_tokens:
         # remove any tool messages we just added
@@ -2,6 +2,7 @@
 """
 Base interfaces and providers for async session storage.
 """
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, TypeVar
 
@@ -30,6 +31,14 @@ class SessionStoreInterface(ABC):
         """List all session IDs, optionally filtered by prefix."""
         ...
 
+    async def get_many(self, session_ids: List[str]) -> List[Optional[Any]]:
+        """Retrieve several sessions, in order, with None for missing IDs.
+        
+        The default issues the lookups concurrently; backends that can
+        fetch many keys in one round-trip should override this.
+        """
+        return list(await asyncio.gather(*(self.get(sid) for sid in session_ids)))
+
 
 class SessionStoreProvider:
     """Provider for a globally-shared async session store."""
@@ -125,12 +125,8 @@ class FileSessionStore(SessionStoreInterface, Generic[T]):
                         data_str = await f.read()
                         data = json.loads(data_str)
                 else:
-                    # If aiofiles not available, use executor to avoid blocking
-                    loop = asyncio.get_running_loop()
-                    data_str = await loop.run_in_executor(
-                        None,
-                        lambda: open(file_path, 'r', encoding='utf-8').read()
-                    )
+                    # If aiofiles not available, use a worker thread to avoid blocking
+                    data_str = await asyncio.to_thread(file_path.read_text, encoding='utf-8')
                     data = json.loads(data_str)
                 
                 session = SessionSerializer.from_dict(data, self.session_class)
@@ -138,7 +134,7 @@ class FileSessionStore(SessionStoreInterface, Generic[T]):
                 self._cache[session_id] = session
                 return session
             except (FileStorageError, json.JSONDecodeError, IOError) as e:
-                logger.error(f"Failed to load session {session_id}: {e}")
+                logger.error("Failed to load session %s: %s", session_id, e)
                 return None
 
     async def save(self, session: T) -> None:
@@ -171,18 +167,14 @@ class FileSessionStore(SessionStoreInterface, Generic[T]):
                     async with aiofiles.open(temp_path, 'w', encoding='utf-8') as f:
                         await f.write(json_str)
                 else:
-                    # If aiofiles not available, use executor to avoid blocking
-                    loop = asyncio.get_running_loop()
-                    await loop.run_in_executor(
-                        None,
-                        lambda: open(temp_path, 'w', encoding='utf-8').write(json_str)
-                    )
+                    # If aiofiles not available, use a worker thread to avoid blocking
+                    await asyncio.to_thread(temp_path.write_text, json_str, encoding='utf-8')
                 
                 # Rename temp file to actual file (atomic operation)
                 os.replace(temp_path, file_path)
                 
             except (FileStorageError, IOError, TypeError) as e:
-                logger.error(f"Failed to save session {session_id}: {e}")
+                logger.error("Failed to save session %s: %s", session_id, e)
                 if temp_path.exists():
                     temp_path.unlink()  # Clean up temp file
                 raise FileStorageError(f"Failed to save session {session_id}: {str(e)}")
@@ -202,11 +194,10 @@ class FileSessionStore(SessionStoreInterface, Generic[T]):
             file_path = self._get_path(session_id)
             if file_path.exists():
                 try:
-                    # Run in executor to avoid blocking
-                    loop = asyncio.get_running_loop()
-                    await loop.run_in_executor(None, file_path.unlink)
+                    # Run in a worker thread to avoid blocking
+                    await asyncio.to_thread(file_path.unlink)
                 except IOError as e:
-                    logger.error(f"Failed to delete session file {session_id}: {e}")
+                    logger.error("Failed to delete session file %s: %s", session_id, e)
                     raise FileStorageError(f"Failed to delete session {session_id}: {str(e)}")
             
             # Remove lock for this session
@@ -216,12 +207,8 @@ class FileSessionStore(SessionStoreInterface, Generic[T]):
     async def list_sessions(self, prefix: str = "") -> List[str]:
         """Async: List all session IDs, optionally filtered by prefix."""
         try:
-            # Run in executor to avoid blocking
-            loop = asyncio.get_running_loop()
-            files = await loop.run_in_executor(
-                None,
-                lambda: list(self.directory.glob("*.json"))
-            )
+            # Run in a worker thread to avoid blocking
+            files = await asyncio.to_thread(lambda: list(self.directory.glob("*.json")))
             
             # Extract the session IDs (filenames without extension)
             session_ids = [f.stem for f in files]
@@ -232,7 +219,7 @@ class FileSessionStore(SessionStoreInterface, Generic[T]):
                 
             return session_ids
         except IOError as e:
-            logger.error(f"Failed to list sessions: {e}")
+            logger.error("Failed to list sessions: %s", e)
             raise FileStorageError(f"Failed to list sessions: {str(e)}")
     
     async def flush(self) -> None:
@@ -251,7 +238,7 @@ class FileSessionStore(SessionStoreInterface, Generic[T]):
             # Log any errors
             for result in results:
                 if isinstance(result, Exception):
-                    logger.error(f"Error during flush: {result}")
+                    logger.error("Error during flush: %s", result)
     
     async def clear_cache(self) -> None:
         """Async: Clear the in-memory cache."""
@@ -268,25 +255,18 @@ class FileSessionStore(SessionStoreInterface, Generic[T]):
         
         try:
             # Find all temp files
-            loop = asyncio.get_running_loop()
-            temp_files = await loop.run_in_executor(
-                None,
-                lambda: list(self.directory.glob("*.tmp"))
-            )
+            temp_files = await asyncio.to_thread(lambda: list(self.directory.glob("*.tmp")))
             
             # Delete temp files
             for temp_file in temp_files:
                 try:
-                    await loop.run_in_executor(None, temp_file.unlink)
+                    await asyncio.to_thread(temp_file.unlink)
                     count += 1
                 except IOError as e:
-                    logger.error(f"Failed to delete temp file {temp_file}: {e}")
+                    logger.error("Failed to delete temp file %s: %s", temp_file, e)
             
             # Find all json files
-            json_files = await loop.run_in_executor(
-                None,
-                lambda: list(self.directory.glob("*.json"))
-            )
+            json_files = await asyncio.to_thread(lambda: list(self.directory.glob("*.json")))
             
             # Check each file for corruption
             for json_file in json_files:
@@ -298,24 +278,18 @@ class FileSessionStore(SessionStoreInterface, Generic[T]):
                             # Just try to parse it to see if it's valid JSON
                             json.loads(data_str)
                     else:
-                        data_str = await loop.run_in_executor(
-                            None,
-                            lambda: open(json_file, 'r', encoding='utf-8').read()
-                        )
+                        data_str = await asyncio.to_thread(json_file.read_text, encoding='utf-8')
                         json.loads(data_str)
                 except (json.JSONDecodeError, IOError) as e:
                     # File is corrupt, rename it
-                    logger.warning(f"Found corrupt file {json_file}: {e}")
+                    logger.warning("Found corrupt file %s: %s", json_file, e)
                     corrupt_path = json_file.with_suffix('.corrupt')
-                    await loop.run_in_executor(
-                        None,
-                        lambda: os.rename(json_file, corrupt_path)
-                    )
+                    await asyncio.to_thread(os.rename, json_file, corrupt_path)
                     count += 1
                     
             return count
         except Exception as e:
-            logger.error(f"Error during vacuum: {e}")
+            logger.error("Error during vacuum: %s", e)
             raise FileStorageError(f"Failed to vacuum storage: {str(e)}")
 
 
@@ -341,8 +315,8 @@ async def create_file_session_store(
     try:
         fixed_count = await store.vacuum()
         if fixed_count > 0:
-            logger.info(f"Cleaned up {fixed_count} temporary or corrupt files during store initialization")
+            logger.info("Cleaned up %s temporary or corrupt files during store initialization", fixed_count)
     except Exception as e:
-        logger.warning(f"Error during initial vacuum: {e}")
+        logger.warning("Error during initial vacuum: %s", e)
         
     return store
\ No newline at end of file
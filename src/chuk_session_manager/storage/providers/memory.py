@@ -27,6 +27,10 @@ class InMemorySessionStore(SessionStoreInterface):
         # Read operations don't need locking
         return self._data.get(session_id)
 
+    async def get_many(self, session_ids: List[str]) -> List[Optional[Any]]:
+        """Async: Retrieve several sessions by ID, with None for missing ones."""
+        return [self._data.get(sid) for sid in session_ids]
+
     async def save(self, session: Any) -> None:
         """Async: Save or update a session object in the store."""
         async with self._lock:
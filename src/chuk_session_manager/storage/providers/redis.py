@@ -103,27 +103,56 @@ class RedisSessionStore(SessionStoreInterface, Generic[T]):
             if self.is_client:
                 data = await self.redis.get(key)
             else:
-                # Fall back to sync client in executor if needed
-                loop = asyncio.get_event_loop()
-                data = await loop.run_in_executor(None, lambda: self.redis.get(key))
+                # Fall back to sync client in a worker thread if needed
+                data = await asyncio.to_thread(self.redis.get, key)
                 
             if not data:
                 return None
             
-            # Convert bytes to str if needed
-            if isinstance(data, bytes):
-                data = data.decode('utf-8')
-                
-            session_dict = json.loads(data)
-            session = cast(T, self.session_class.model_validate(session_dict))
-            
-            # Update cache
-            self._cache[session_id] = session
-            return session
+            return self._load(session_id, data)
         except (RedisError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to load session {session_id} from Redis: {e}")
+            logger.error("Failed to load session %s from Redis: %s", session_id, e)
             return None
 
+    async def get_many(self, session_ids: List[str]) -> List[Optional[T]]:
+        """Async: Retrieve several sessions with a single MGET round-trip."""
+        # each uncached ID is fetched once, however often it is requested
+        missing = list(dict.fromkeys(sid for sid in session_ids if sid not in self._cache))
+        if missing:
+            keys = [self._get_key(sid) for sid in missing]
+            try:
+                if self.is_client:
+                    values = await self.redis.mget(keys)
+                else:
+                    # Fall back to sync client in a worker thread if needed
+                    values = await asyncio.to_thread(self.redis.mget, keys)
+            except RedisError as e:
+                logger.error("Failed to load sessions from Redis: %s", e)
+                values = [None] * len(missing)
+
+            for session_id, data in zip(missing, values):
+                if not data:
+                    continue
+                try:
+                    self._load(session_id, data)
+                except json.JSONDecodeError as e:
+                    logger.error("Failed to load session %s from Redis: %s", session_id, e)
+
+        return [self._cache.get(sid) for sid in session_ids]
+
+    def _load(self, session_id: str, data: Union[str, bytes]) -> T:
+        """Deserialize a stored session and add it to the cache."""
+        # Convert bytes to str if needed
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+            
+        session_dict = json.loads(data)
+        session = cast(T, self.session_class.model_validate(session_dict))
+        
+        # Update cache
+        self._cache[session_id] = session
+        return session
+
     async def save(self, session: T) -> None:
         """Async: Save a session to the store."""
         session_id = session.id
@@ -150,20 +179,15 @@ class RedisSessionStore(SessionStoreInterface, Generic[T]):
                 else:
                     await self.redis.set(key, data)
             else:
-                # Fall back to sync client in executor if needed
-                loop = asyncio.get_event_loop()
+                # Fall back to sync client in a worker thread if needed
                 if self.expiration_seconds:
-                    await loop.run_in_executor(
-                        None, 
-                        lambda: self.redis.setex(key, self.expiration_seconds, data)
+                    await asyncio.to_thread(
+                        self.redis.setex, key, self.expiration_seconds, data
                     )
                 else:
-                    await loop.run_in_executor(
-                        None,
-                        lambda: self.redis.set(key, data)
-                    )
+                    await asyncio.to_thread(self.redis.set, key, data)
         except (RedisError, TypeError) as e:
-            logger.error(f"Failed to save session {session_id} to Redis: {e}")
+            logger.error("Failed to save session %s to Redis: %s", session_id, e)
             raise RedisStorageError(f"Failed to save session {session_id}: {str(e)}")
 
     async def delete(self, session_id: str) -> None:
@@ -178,11 +202,10 @@ class RedisSessionStore(SessionStoreInterface, Generic[T]):
             if self.is_client:
                 await self.redis.delete(key)
             else:
-                # Fall back to sync client in executor if needed
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, lambda: self.redis.delete(key))
+                # Fall back to sync client in a worker thread if needed
+                await asyncio.to_thread(self.redis.delete, key)
         except RedisError as e:
-            logger.error(f"Failed to delete session {session_id} from Redis: {e}")
+            logger.error("Failed to delete session %s from Redis: %s", session_id, e)
             raise RedisStorageError(f"Failed to delete session {session_id}: {str(e)}")
     
     async def list_sessions(self, prefix: str = "") -> List[str]:
@@ -193,9 +216,8 @@ class RedisSessionStore(SessionStoreInterface, Generic[T]):
             if self.is_client:
                 keys = await self.redis.keys(search_pattern)
             else:
-                # Fall back to sync client in executor if needed
-                loop = asyncio.get_event_loop()
-                keys = await loop.run_in_executor(None, lambda: self.redis.keys(search_pattern))
+                # Fall back to sync client in a worker thread if needed
+                keys = await asyncio.to_thread(self.redis.keys, search_pattern)
                 
             # Extract session IDs by removing the prefix
             session_ids = [
@@ -205,7 +227,7 @@ class RedisSessionStore(SessionStoreInterface, Generic[T]):
             ]
             return session_ids
         except RedisError as e:
-            logger.error(f"Failed to list sessions from Redis: {e}")
+            logger.error("Failed to list sessions from Redis: %s", e)
             raise RedisStorageError(f"Failed to list sessions: {str(e)}")
     
     async def flush(self) -> None:
@@ -228,11 +250,10 @@ class RedisSessionStore(SessionStoreInterface, Generic[T]):
             if self.is_client:
                 await self.redis.expire(key, seconds)
             else:
-                # Fall back to sync client in executor if needed
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, lambda: self.redis.expire(key, seconds))
+                # Fall back to sync client in a worker thread if needed
+                await asyncio.to_thread(self.redis.expire, key, seconds)
         except RedisError as e:
-            logger.error(f"Failed to set expiration for session {session_id}: {e}")
+            logger.error("Failed to set expiration for session %s: %s", session_id, e)
             raise RedisStorageError(f"Failed to set expiration for session {session_id}: {str(e)}")
 
 
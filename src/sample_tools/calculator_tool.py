@@ -13,12 +13,22 @@ It accepts the same argument schema your demo already sends:
 from __future__ import annotations
 
 import asyncio
-from typing import Dict
+import operator
+from typing import Callable, Dict
 
 from chuk_tool_processor.models.validated_tool import ValidatedTool
 from chuk_tool_processor.registry.decorators import register_tool
 
 
+# operation name → arithmetic function, resolved with one dict lookup
+_OPERATIONS: Dict[str, Callable[[float, float], float]] = {
+    "add":      operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide":   operator.truediv,
+}
+
+
 @register_tool(name="calculator")
 class CalculatorTool(ValidatedTool):
     """Perform basic arithmetic."""
@@ -35,20 +45,13 @@ class CalculatorTool(ValidatedTool):
 
     # ── internal calculation (blocking)────────────────────────────
     def _execute(self, operation: str, a: float, b: float) -> Dict:
-        if operation == "add":
-            result = a + b
-        elif operation == "subtract":
-            result = a - b
-        elif operation == "multiply":
-            result = a * b
-        elif operation == "divide":
-            if b == 0:
-                raise ValueError("Division by zero")
-            result = a / b
-        else:
+        fn = _OPERATIONS.get(operation)
+        if fn is None:
             raise ValueError(f"Unknown operation: {operation}")
+        if fn is operator.truediv and b == 0:
+            raise ValueError("Division by zero")
 
-        return {"result": result, "operation": operation}
+        return {"result": fn(a, b), "operation": operation}
 
     # ── sync entry-point (required by ValidatedTool) ───────────────
     def run(self, **kwargs) -> Dict:
@@ -22,7 +22,7 @@ import re
 import time
 from html import unescape
 from typing import Dict, List
-from urllib.parse import urlparse, parse_qs, unquote
+from urllib.parse import unquote_plus
 
 import httpx
 from chuk_tool_processor.registry.decorators import register_tool
@@ -35,12 +35,13 @@ _HEADERS = {
 }
 
 
+_DDG_REDIRECT = re.compile(r"//duckduckgo\.com/l/\?(?:[^#]*?&)?uddg=([^&#]*)")
+
+
 def _clean_ddg_link(raw: str) -> str:
     """Return the direct target for DDG redirect URLs, else *raw*."""
-    if not raw.startswith("//duckduckgo.com/l/"):
-        return raw
-    qs = parse_qs(urlparse(raw).query)
-    return unquote(qs.get("uddg", [""])[0]) or raw
+    m = _DDG_REDIRECT.match(raw)
+    return (unquote_plus(m.group(1)) if m else "") or raw
 
 
 def _search_ddg_html(query: str, max_results: int) -> List[Dict]:
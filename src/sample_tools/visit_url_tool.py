@@ -19,12 +19,12 @@ from chuk_tool_processor.models.validated_tool import ValidatedTool
 
 
 # ── helpers ────────────────────────────────────────────────────────
+_DDG_REDIRECT = re.compile(r"duckduckgo\.com/l/\?(?:[^#]*?&)?uddg=([^&#]*)")
+
+
 def _unwrap_ddg(url: str) -> str:
-    if "duckduckgo.com/l/" not in url:
-        return url
-    parsed = urllib.parse.urlparse(url)
-    qs = urllib.parse.parse_qs(parsed.query)
-    return urllib.parse.unquote(qs.get("uddg", [""])[0]) or url
+    m = _DDG_REDIRECT.search(url)
+    return (urllib.parse.unquote_plus(m.group(1)) if m else "") or url
 
 
 def _scrub_html(html: str) -> tuple[str, str]:
@@ -138,6 +138,21 @@ async def test_add_event():
     assert event in sess.events
 
 
+@pytest.mark.asyncio
+async def test_add_events():
+    sess = Session[MessageT]()
+    first = SessionEvent(message="first")
+    second = await SessionEvent.create_with_tokens(
+        message="second",
+        prompt="second",
+        model="gpt-3.5-turbo",
+    )
+    
+    await sess.add_events([first, second])
+    assert sess.events == [first, second]
+    assert sess.total_tokens == second.token_usage.total_tokens
+
+
 @pytest.mark.asyncio
 async def test_add_event_and_save(in_memory_store):
     sess = Session[MessageT]()
@@ -154,6 +169,22 @@ async def test_add_event_and_save(in_memory_store):
     assert event in saved_sess.events
 
 
+@pytest.mark.asyncio
+async def test_add_events_and_save(in_memory_store):
+    sess = Session[MessageT]()
+    await in_memory_store.save(sess)
+    
+    events = [SessionEvent(message="one"), SessionEvent(message="two")]
+    await sess.add_events_and_save(events)
+    
+    # Verify events are added in order
+    assert sess.events == events
+    
+    # Verify session was saved
+    saved_sess = await in_memory_store.get(sess.id)
+    assert saved_sess.events == events
+
+
 @pytest.mark.asyncio
 async def test_token_usage_by_source():
     sess = Session[MessageT]()
@@ -283,4 +314,15 @@ async def test_create_class_method(in_memory_store):
     
     # Verify session was saved
     saved_sess = await in_memory_store.get(sess.id)
-    assert saved_sess is not None
\ No newline at end of file
+    assert saved_sess is not None
+
+def test_events_by_type():
+    sess = Session[MessageT]()
+    msg = SessionEvent(message="hi")
+    summary = SessionEvent(message="sum", type=EventType.SUMMARY)
+    tool = SessionEvent(message="tool", type=EventType.TOOL_CALL)
+    sess.events = [msg, summary, tool]
+    
+    assert sess.events_by_type(EventType.SUMMARY) == [summary]
+    assert sess.events_by_type(EventType.MESSAGE, EventType.TOOL_CALL) == [msg, tool]
+    assert sess.events_by_type(EventType.REFERENCE) == []
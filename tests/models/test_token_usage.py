@@ -3,6 +3,7 @@ import asyncio
 import time
 from datetime import datetime, timezone
 
+from chuk_session_manager.models import token_usage as token_usage_module
 from chuk_session_manager.models.token_usage import TokenUsage, TokenSummary
 
 
@@ -124,6 +125,31 @@ async def test_count_tokens_async():
     assert await TokenUsage.count_tokens(None, "gpt-3.5-turbo") == 0
 
 
+def test_encoding_is_cached_per_model(monkeypatch):
+    """Test that the tiktoken encoding is only resolved once per model."""
+    calls = []
+
+    class FakeEncoding:
+        def encode(self, text):
+            return text.split()
+
+    class FakeTiktoken:
+        @staticmethod
+        def encoding_for_model(model):
+            calls.append(model)
+            return FakeEncoding()
+
+    monkeypatch.setattr(token_usage_module, "tiktoken", FakeTiktoken, raising=False)
+    monkeypatch.setattr(token_usage_module, "TIKTOKEN_AVAILABLE", True)
+    token_usage_module._get_encoding.cache_clear()
+    try:
+        assert TokenUsage._count_tokens_sync("one two three", "fake-model") == 3
+        assert TokenUsage._count_tokens_sync("four five", "fake-model") == 2
+        assert calls == ["fake-model"]
+    finally:
+        token_usage_module._get_encoding.cache_clear()
+
+
 def test_token_usage_addition():
     """Test adding two TokenUsage instances."""
     usage1 = TokenUsage(
@@ -236,4 +262,11 @@ async def test_concurrent_token_operations():
     
     # All results should be the same
     assert len(set(results)) == 1  # Only one unique result
-    assert results[0] > 0
\ No newline at end of file
+    assert results[0] > 0
+
+@pytest.mark.asyncio
+async def test_count_tokens_batch_matches_single_counts():
+    texts = ["Hello world", None, "A slightly longer piece of text to count."]
+    counts = await TokenUsage.count_tokens_batch(texts, "gpt-3.5-turbo")
+    assert counts == [await TokenUsage.count_tokens(t, "gpt-3.5-turbo") for t in texts]
+    assert counts[1] == 0
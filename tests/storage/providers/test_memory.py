@@ -52,6 +52,19 @@ class TestInMemorySessionStore:
         # Should return None
         assert nonexistent is None
     
+    @pytest.mark.asyncio
+    async def test_get_many(self, store):
+        """Test retrieving several sessions at once."""
+        sessions = [await create_test_session() for _ in range(3)]
+        for session in sessions:
+            await store.save(session)
+        
+        ids = [sessions[2].id, "does-not-exist", sessions[0].id]
+        results = await store.get_many(ids)
+        
+        # Order follows the requested IDs, with None for missing sessions
+        assert results == [sessions[2], None, sessions[0]]
+    
     @pytest.mark.asyncio
     async def test_delete(self, store):
         """Test deleting a session."""
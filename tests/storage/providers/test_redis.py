@@ -156,3 +156,77 @@ async def create_redis_session_store(
         auto_save=auto_save,
         session_class=session_class,
     )
+
+
+# ---------------------------------------------------------------------------
+# Tests for the provider's batched get_many (mocked sync client)
+# ---------------------------------------------------------------------------
+import pytest  # noqa: E402
+from unittest.mock import MagicMock  # noqa: E402
+
+redis_exceptions = pytest.importorskip("redis.exceptions")
+
+from chuk_session_manager.storage.providers import redis as redis_provider  # noqa: E402
+from tests.storage.test_base import create_test_session  # noqa: E402
+
+
+class TestProviderGetMany:
+    """Tests for RedisSessionStore.get_many from the storage providers."""
+
+    @pytest.fixture
+    def client(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def store(self, client):
+        return redis_provider.RedisSessionStore(client, key_prefix="s:")
+
+    @staticmethod
+    def _dump(store, session) -> bytes:
+        return json.dumps(session.model_dump(), default=store._json_default).encode()
+
+    @pytest.mark.asyncio
+    async def test_mixes_cached_and_fetched_sessions(self, store, client):
+        cached, stored = await create_test_session(), await create_test_session()
+        store._cache[cached.id] = cached
+        client.mget.return_value = [self._dump(store, stored), None]
+
+        results = await store.get_many([stored.id, cached.id, "missing", stored.id])
+
+        # one round-trip, only for the uncached IDs, each requested once
+        client.mget.assert_called_once_with([f"s:{stored.id}", "s:missing"])
+        assert [r.id if r else None for r in results] == [
+            stored.id, cached.id, None, stored.id,
+        ]
+        assert results[0] is results[3]
+        assert store._cache[stored.id] is results[0]
+
+    @pytest.mark.asyncio
+    async def test_undecodable_value_is_skipped(self, store, client):
+        good = await create_test_session()
+        client.mget.return_value = [b"{not json", self._dump(store, good)]
+
+        results = await store.get_many(["broken", good.id])
+
+        client.mget.assert_called_once()
+        assert results[0] is None
+        assert results[1].id == good.id
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_none(self, store, client):
+        cached = await create_test_session()
+        store._cache[cached.id] = cached
+        client.mget.side_effect = redis_exceptions.RedisError("down")
+
+        results = await store.get_many(["a", cached.id, "b"])
+
+        client.mget.assert_called_once_with(["s:a", "s:b"])
+        assert results == [None, cached, None]
+
+    @pytest.mark.asyncio
+    async def test_all_cached_skips_redis(self, store, client):
+        cached = await create_test_session()
+        store._cache[cached.id] = cached
+
+        assert await store.get_many([cached.id]) == [cached]
+        client.mget.assert_not_called()
@@ -0,0 +1,40 @@
+# tests/test_sample_tools.py
+"""
+Tests for the DuckDuckGo redirect helpers in the sample tools.
+"""
+import pytest
+
+# the sample tools need the dev dependency group (geopy, bs4, httpx)
+search_tool = pytest.importorskip("sample_tools.search_tool")
+visit_url_tool = pytest.importorskip("sample_tools.visit_url_tool")
+
+_TARGET = "https%3A%2F%2Fex.com%2Fa%3Fq%3Da%2520b"
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        # decoded once: an encoded "%20" in the target URL is kept as-is
+        (f"uddg={_TARGET}", "https://ex.com/a?q=a%20b"),
+        # "+" is a form-encoded space
+        ("uddg=https%3A%2F%2Fex.com%2F%3Fq%3Da+b", "https://ex.com/?q=a b"),
+        # uddg after other parameters
+        (f"kh=-1&uddg={_TARGET}&rut=abc", "https://ex.com/a?q=a%20b"),
+    ],
+)
+def test_ddg_redirects_are_unwrapped(query, expected):
+    assert search_tool._clean_ddg_link(f"//duckduckgo.com/l/?{query}") == expected
+    assert visit_url_tool._unwrap_ddg(f"https://duckduckgo.com/l/?{query}") == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/page?uddg=x",
+        "//duckduckgo.com/l/?uddg=",
+        "//duckduckgo.com/l/?kh=-1",
+    ],
+)
+def test_non_redirects_are_returned_unchanged(url):
+    assert search_tool._clean_ddg_link(url) == url
+    assert visit_url_tool._unwrap_ddg(url) == url
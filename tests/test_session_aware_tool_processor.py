@@ -5,10 +5,13 @@ Async tests for chuk-style SessionAwareToolProcessor.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from unittest.mock import AsyncMock, patch
 
 import pytest
 import pytest_asyncio
+from chuk_tool_processor.core.processor import ToolProcessor
 
 from chuk_session_manager.models.session import Session
 from chuk_session_manager.models.event_type import EventType
@@ -17,8 +20,11 @@ from chuk_session_manager.storage import (
     SessionStoreProvider,
 )
 from chuk_session_manager.session_aware_tool_processor import (
+    CachePolicy,
     SessionAwareToolProcessor,
     ToolResult,
+    ToolResultCache,
+    _json_dumps,
 )
 
 # ───────────────────────── fixtures ──────────────────────────
@@ -44,6 +50,19 @@ def _dummy_msg():
     }
 
 
+def _multi_msg(*names):
+    return {
+        "tool_calls": [
+            {
+                "id": f"cid_{name}",
+                "type": "function",
+                "function": {"name": name, "arguments": "{}"},
+            }
+            for name in names
+        ]
+    }
+
+
 async def _noop_llm(_: str) -> dict:  # placeholder callback
     return {}
 
@@ -109,3 +128,424 @@ async def test_max_retries_exceeded(sid):
     with patch.object(proc, "_exec_calls", AsyncMock(side_effect=Exception("boom"))):
         out = await proc.process_llm_message(_dummy_msg(), _noop_llm)
         assert out[0].error and "boom" in out[0].error
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently(sid):
+    proc = await SessionAwareToolProcessor.create(
+        session_id=sid, enable_caching=False, max_retries=0
+    )
+    started = 0
+    both_started = asyncio.Event()
+
+    async def fake_exec(calls):
+        # each call only finishes once the other one has started
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        name = calls[0]["function"]["name"]
+        return [ToolResult(tool=name, result=name)]
+
+    with patch.object(proc, "_exec_calls", fake_exec):
+        out = await proc.process_llm_message(_multi_msg("a", "b"), _noop_llm)
+
+    # results keep the order of the tool_calls in the message
+    assert [r.result for r in out] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_events_saved_once_per_message(sid):
+    proc = await SessionAwareToolProcessor.create(session_id=sid, enable_caching=False)
+    store = SessionStoreProvider.get_store()
+
+    with patch.object(
+        proc,
+        "_exec_calls",
+        AsyncMock(return_value=[ToolResult(tool="t", result={"v": 1})]),
+    ), patch.object(store, "save", wraps=store.save) as save:
+        await proc.process_llm_message(_multi_msg("a", "b"), _noop_llm)
+        save.assert_awaited_once()
+
+    sess = await store.get(sid)
+    assert [e.type for e in sess.events] == [
+        EventType.MESSAGE,
+        EventType.TOOL_CALL,
+        EventType.TOOL_CALL,
+    ]
+
+
+def test_cache_key_ignores_argument_order():
+    key = SessionAwareToolProcessor._cache_key
+    assert key("t", {"a": 1, "b": 2}) == key("t", {"b": 2, "a": 1})
+    assert key("t", {"a": 1}) != key("u", {"a": 1})
+    assert key("t", {"a": 1}) != key("t", {"a": 2})
+
+
+def test_cache_key_does_not_depend_on_orjson():
+    args = {"location": "Zürich", "units": ["°C", 1.5], "n": 2}
+    key = SessionAwareToolProcessor._cache_key
+    with patch(f"{SessionAwareToolProcessor.__module__}.ORJSON_AVAILABLE", True):
+        fast = key("t", args)
+    with patch(f"{SessionAwareToolProcessor.__module__}.ORJSON_AVAILABLE", False):
+        plain = key("t", args)
+    assert fast == plain
+
+
+def test_json_dumps_does_not_depend_on_orjson():
+    obj = {"location": "Zürich", "hits": [1, 2.5, None]}
+    with patch(f"{SessionAwareToolProcessor.__module__}.ORJSON_AVAILABLE", True):
+        fast = _json_dumps(obj)
+    with patch(f"{SessionAwareToolProcessor.__module__}.ORJSON_AVAILABLE", False):
+        plain = _json_dumps(obj)
+    assert fast == plain == '{"location":"Zürich","hits":[1,2.5,null]}'
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = ToolResultCache(max_entries=2)
+    cache.set("a", ToolResult(tool="t", result=1))
+    cache.set("b", ToolResult(tool="t", result=2))
+    assert cache.get("a").result == 1  # "a" is now most recent
+    cache.set("c", ToolResult(tool="t", result=3))
+
+    assert cache.get("b") is None
+    assert cache.get("a").result == 1
+    assert cache.get("c").result == 3
+    assert len(cache) == 2
+
+
+def test_result_cache_expires_entries():
+    cache = ToolResultCache()
+    cache.set("k", ToolResult(tool="t", result=1), ttl=0)
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_non_cacheable_tool_always_executes(sid):
+    proc = await SessionAwareToolProcessor.create(
+        session_id=sid, cache_policies={"t": CachePolicy(cacheable=False)}
+    )
+
+    with patch.object(
+        proc,
+        "_exec_calls",
+        AsyncMock(return_value=[ToolResult(tool="t", result={"v": 1})]),
+    ) as exec_calls:
+        await proc.process_llm_message(_dummy_msg(), _noop_llm)
+        await proc.process_llm_message(_dummy_msg(), _noop_llm)
+        assert exec_calls.await_count == 2
+    assert len(proc.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_execute_once(sid):
+    proc = await SessionAwareToolProcessor.create(session_id=sid)
+
+    async def slow_exec(calls):
+        await asyncio.sleep(0)
+        return [ToolResult(tool="t", result={"v": 1})]
+
+    with patch.object(proc, "_exec_calls", AsyncMock(side_effect=slow_exec)) as exec_calls:
+        out = await proc.process_llm_message(_multi_msg("t", "t"), _noop_llm)
+        exec_calls.assert_awaited_once()
+
+    assert [r.result for r in out] == [{"v": 1}, {"v": 1}]
+    sess = await SessionStoreProvider.get_store().get(sid)
+    cached = [e.message["cached"] for e in sess.events if e.type == EventType.TOOL_CALL]
+    assert cached == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_waiter_takes_over_when_owner_is_cancelled(sid):
+    proc = await SessionAwareToolProcessor.create(session_id=sid)
+    started = asyncio.Event()
+
+    async def slow_exec(calls):
+        if not started.is_set():
+            started.set()
+            await asyncio.sleep(10)
+        return [ToolResult(tool="t", result={"v": 1})]
+
+    with patch.object(proc, "_exec_calls", AsyncMock(side_effect=slow_exec)) as exec_calls:
+        owner = asyncio.create_task(proc.process_llm_message(_dummy_msg(), _noop_llm))
+        await started.wait()
+        waiter = asyncio.create_task(proc.process_llm_message(_dummy_msg(), _noop_llm))
+        await asyncio.sleep(0.01)  # let the waiter join the in-flight call
+        owner.cancel()
+        out = await waiter
+
+    assert owner.cancelled()
+    assert out[0].result == {"v": 1}
+    assert exec_calls.await_count == 2
+    assert not proc._inflight
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_in_completion_order(sid):
+    proc = await SessionAwareToolProcessor.create(session_id=sid, enable_caching=False)
+
+    async def fake_exec(calls):
+        name = calls[0]["function"]["name"]
+        if name == "slow":
+            await asyncio.sleep(0.01)
+        return [ToolResult(tool=name, result=name)]
+
+    with patch.object(proc, "_exec_calls", fake_exec):
+        out = [
+            r.result
+            async for r in proc.process_llm_message_stream(
+                _multi_msg("slow", "fast"), _noop_llm
+            )
+        ]
+
+    assert out == ["fast", "slow"]
+
+    # events are still recorded in tool_calls order
+    sess = await SessionStoreProvider.get_store().get(sid)
+    tools = [e.message["tool"] for e in sess.events if e.type == EventType.TOOL_CALL]
+    assert tools == ["slow", "fast"]
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_saves_finished_calls(sid):
+    proc = await SessionAwareToolProcessor.create(session_id=sid, enable_caching=False)
+
+    async def fake_exec(calls):
+        name = calls[0]["function"]["name"]
+        if name == "slow":
+            await asyncio.sleep(10)
+        return [ToolResult(tool=name, result=name)]
+
+    with patch.object(proc, "_exec_calls", fake_exec):
+        stream = proc.process_llm_message_stream(
+            _multi_msg("slow", "fast_a", "fast_b"), _noop_llm
+        )
+        async with contextlib.aclosing(stream):
+            seen = []
+            async for res in stream:
+                seen.append(res.result)
+                if len(seen) == 2:
+                    break
+
+    assert sorted(seen) == ["fast_a", "fast_b"]
+    # the cancelled slow call is dropped; the rest keep tool_calls order
+    sess = await SessionStoreProvider.get_store().get(sid)
+    assert [e.type for e in sess.events] == [
+        EventType.MESSAGE,
+        EventType.TOOL_CALL,
+        EventType.TOOL_CALL,
+    ]
+    tools = [e.message["tool"] for e in sess.events_by_type(EventType.TOOL_CALL)]
+    assert tools == ["fast_a", "fast_b"]
+
+
+@pytest.mark.asyncio
+async def test_stream_break_then_aclose_saves_finished_calls(sid):
+    proc = await SessionAwareToolProcessor.create(session_id=sid)
+
+    async def fake_exec(calls):
+        name = calls[0]["function"]["name"]
+        if name == "slow":
+            await asyncio.sleep(10)
+        return [ToolResult(tool=name, result=name)]
+
+    with patch.object(proc, "_exec_calls", fake_exec):
+        stream = proc.process_llm_message_stream(_multi_msg("slow", "fast"), _noop_llm)
+        async for res in stream:
+            break
+        await stream.aclose()
+
+    assert res.result == "fast"
+    assert not proc._inflight  # the cancelled call released its key
+    sess = await SessionStoreProvider.get_store().get(sid)
+    tools = [e.message["tool"] for e in sess.events_by_type(EventType.TOOL_CALL)]
+    assert tools == ["fast"]
+
+
+@pytest.mark.asyncio
+async def test_malformed_arguments_are_tolerated(sid):
+    proc = await SessionAwareToolProcessor.create(session_id=sid)
+    msg = _dummy_msg()
+    msg["tool_calls"][0]["function"]["arguments"] = "{not json"
+
+    with patch.object(
+        proc,
+        "_exec_calls",
+        AsyncMock(return_value=[ToolResult(tool="t", result={"v": 1})]),
+    ):
+        out = await proc.process_llm_message(msg, _noop_llm)
+
+    assert out[0].result == {"v": 1}
+
+
+@pytest.mark.asyncio
+async def test_dict_arguments_are_used_as_is(sid):
+    proc = await SessionAwareToolProcessor.create(session_id=sid)
+    msg = _dummy_msg()
+    msg["tool_calls"][0]["function"]["arguments"] = {"location": "London"}
+
+    proc._execute = AsyncMock(return_value=[ToolResult(tool="t", result={"v": 1})])
+    out = await proc.process_llm_message(msg, _noop_llm)
+
+    (tool_calls,), _ = proc._execute.call_args
+    assert tool_calls[0].arguments == {"location": "London"}
+    assert out[0].result == {"v": 1}
+
+
+def test_backoff_is_exponential_and_capped():
+    proc = SessionAwareToolProcessor(
+        "sid", retry_delay=0.5, retry_max=3.0, retry_jitter=False
+    )
+    assert [proc._backoff(a) for a in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+
+    jittered = SessionAwareToolProcessor("sid", retry_delay=1.0)
+    assert all(0.5 <= jittered._backoff(1) < 1.5 for _ in range(20))
+
+
+@pytest.mark.asyncio
+async def test_explicit_store_is_used(sid):
+    own_store = InMemorySessionStore()
+    sess = Session()
+    await own_store.save(sess)
+
+    proc = await SessionAwareToolProcessor.create(session_id=sess.id, store=own_store)
+    with patch.object(
+        proc,
+        "_exec_calls",
+        AsyncMock(return_value=[ToolResult(tool="t", result={"v": 1})]),
+    ):
+        await proc.process_llm_message(_dummy_msg(), _noop_llm)
+
+    saved = await own_store.get(sess.id)
+    assert [e.type for e in saved.events] == [EventType.MESSAGE, EventType.TOOL_CALL]
+    assert await SessionStoreProvider.get_store().get(sess.id) is None
+
+
+class _DictCache:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, res, ttl=None):
+        self.data[key] = res
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_is_shared_between_processors(sid):
+    shared = _DictCache()
+    first = await SessionAwareToolProcessor.create(session_id=sid, shared_cache=shared)
+    with patch.object(
+        first,
+        "_exec_calls",
+        AsyncMock(return_value=[ToolResult(tool="t", result={"v": 1})]),
+    ):
+        await first.process_llm_message(_dummy_msg(), _noop_llm)
+    await asyncio.gather(*first._background)
+    assert len(shared.data) == 1
+
+    second = await SessionAwareToolProcessor.create(session_id=sid, shared_cache=shared)
+    with patch.object(second, "_exec_calls", AsyncMock()) as exec_calls:
+        out = await second.process_llm_message(_dummy_msg(), _noop_llm)
+        exec_calls.assert_not_called()
+    assert out[0].result == {"v": 1}
+    assert len(second.cache) == 1  # promoted into the local LRU
+
+
+@pytest.mark.asyncio
+async def test_canonicalizer_merges_equivalent_arguments(sid):
+    def lower_location(args):
+        return {**args, "location": args["location"].lower()}
+
+    proc = await SessionAwareToolProcessor.create(
+        session_id=sid, canonicalizers={"t": lower_location}
+    )
+    msg = _dummy_msg()
+    msg["tool_calls"][0]["function"]["arguments"] = '{"location": "New York"}'
+    with patch.object(
+        proc,
+        "_exec_calls",
+        AsyncMock(return_value=[ToolResult(tool="t", result={"v": 1})]),
+    ):
+        await proc.process_llm_message(msg, _noop_llm)
+
+    msg["tool_calls"][0]["function"]["arguments"] = '{"location": "new york"}'
+    with patch.object(proc, "_exec_calls", AsyncMock()) as exec_calls:
+        out = await proc.process_llm_message(msg, _noop_llm)
+        exec_calls.assert_not_called()
+    assert out[0].result == {"v": 1}
+
+
+@pytest.mark.asyncio
+async def test_unlogged_cache_hits_are_listed_on_message(sid):
+    proc = await SessionAwareToolProcessor.create(session_id=sid, log_cache_hits=False)
+    with patch.object(
+        proc,
+        "_exec_calls",
+        AsyncMock(return_value=[ToolResult(tool="t", result={"v": 1})]),
+    ):
+        await proc.process_llm_message(_dummy_msg(), _noop_llm)
+        await proc.process_llm_message(_dummy_msg(), _noop_llm)
+
+    sess = await SessionStoreProvider.get_store().get(sid)
+    assert [e.type for e in sess.events] == [
+        EventType.MESSAGE,
+        EventType.TOOL_CALL,
+        EventType.MESSAGE,
+    ]
+    assert "cached_calls" not in sess.events[0].metadata
+    assert sess.events[2].metadata["cached_calls"] == [{"call_id": "cid", "tool": "t"}]
+
+
+@pytest.mark.asyncio
+async def test_unlogged_coalesced_calls_are_listed_on_message(sid):
+    proc = await SessionAwareToolProcessor.create(session_id=sid, log_cache_hits=False)
+
+    async def slow_exec(calls):
+        await asyncio.sleep(0)
+        return [ToolResult(tool="t", result={"v": 1})]
+
+    with patch.object(proc, "_exec_calls", AsyncMock(side_effect=slow_exec)) as exec_calls:
+        out = await proc.process_llm_message(_multi_msg("t", "t"), _noop_llm)
+        exec_calls.assert_awaited_once()
+
+    assert [r.result for r in out] == [{"v": 1}, {"v": 1}]
+    sess = await SessionStoreProvider.get_store().get(sid)
+    assert [e.type for e in sess.events] == [EventType.MESSAGE, EventType.TOOL_CALL]
+    assert sess.events[0].metadata["cached_calls"] == [{"call_id": "cid_t", "tool": "t"}]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_failure_is_not_logged_as_cached(sid):
+    proc = await SessionAwareToolProcessor.create(
+        session_id=sid, max_retries=0, log_cache_hits=False
+    )
+
+    async def failing_exec(calls):
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    with patch.object(proc, "_exec_calls", AsyncMock(side_effect=failing_exec)):
+        out = await proc.process_llm_message(_multi_msg("t", "t"), _noop_llm)
+
+    assert [r.error for r in out] == ["boom", "boom"]
+    sess = await SessionStoreProvider.get_store().get(sid)
+    tool_events = sess.events_by_type(EventType.TOOL_CALL)
+    assert [e.message["cached"] for e in tool_events] == [False, False]
+    assert [e.metadata.get("coalesced", False) for e in tool_events] == [False, True]
+    assert "cached_calls" not in sess.events[0].metadata
+
+
+@pytest.mark.asyncio
+async def test_tool_processor_can_be_shared(sid):
+    first = await SessionAwareToolProcessor.create(session_id=sid)
+    second = await SessionAwareToolProcessor.create(session_id=sid)
+    assert first._tp is not second._tp
+
+    own = ToolProcessor()
+    third = await SessionAwareToolProcessor.create(session_id=sid, tool_processor=own)
+    fourth = await SessionAwareToolProcessor.create(session_id=sid, tool_processor=own)
+    assert third._tp is own and fourth._tp is own
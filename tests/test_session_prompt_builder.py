@@ -51,7 +51,42 @@ async def test_tool_and_retry_and_strategies():
     assert any(m["role"] == "tool" for m in p)
 
     long_prompt = [{"role": "user", "content": "u"}] * 10
-    # patch the *synchronous* count_tokens so it returns an int
-    with patch.object(TokenUsage, "count_tokens", return_value=1000):
+    # patch the batch counter so every message looks expensive
+    with patch.object(
+        TokenUsage, "count_tokens_batch", AsyncMock(side_effect=lambda texts, *_, **__: [1000] * len(texts))
+    ):
         out = await truncate_prompt_to_token_limit(long_prompt, max_tokens=1)
     assert len(out) < len(long_prompt)
+
+
+@pytest.mark.asyncio
+async def test_truncate_counts_each_message_once():
+    prompt = [
+        {"role": "user", "content": "first"},
+        {"role": "assistant", "content": "old"},
+        {"role": "user", "content": "second"},
+        {"role": "assistant", "content": "latest"},
+        {"role": "tool", "name": "t", "content": "result"},
+    ]
+    counter = AsyncMock(return_value=[10, 10, 10, 10, 10])
+    with patch.object(TokenUsage, "count_tokens_batch", counter):
+        assert await truncate_prompt_to_token_limit(prompt, max_tokens=50) == prompt
+        out = await truncate_prompt_to_token_limit(prompt, max_tokens=30)
+
+    # first user message + everything from the last assistant onwards
+    assert out == [prompt[0], prompt[3], prompt[4]]
+    assert counter.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_truncate_does_not_undercount_joined_prompt():
+    # 40 messages sized so that flooring each count would lose tokens
+    prompt = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i} ab"}
+        for i in range(40)
+    ]
+    joined = "\n".join(f"{m['role']}: {m['content']}" for m in prompt)
+    limit = await TokenUsage.count_tokens(joined) - 1
+
+    out = await truncate_prompt_to_token_limit(prompt, max_tokens=limit)
+    assert len(out) < len(prompt)